@@ -33,6 +33,8 @@ from tesseract_router import (
     TesseractRouter, 
     InferenceRequest, 
     BackendStatus, 
+    BackendScorer, 
+    DEGRADED_SCORE_FACTOR,
     load_all_requests
 )
 
@@ -257,11 +259,11 @@ def route_request():
         for backend in result.considered_backends:
             # Simple score based on latency and cost
             network_latency = router.network_latency.get_latency(user_region, backend.region)
-            base_score = backend.latency_ms * backend.cost_per_token
+            base_score = BackendScorer.calculate_base_score(backend, result.request)
             
             # Adjustments
             if backend.status == BackendStatus.DEGRADED:
-                base_score *= 1.5
+                base_score *= DEGRADED_SCORE_FACTOR
             
             # Load adjustment
             load_factor = 1 + (backend.current_load / 100)
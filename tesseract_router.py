@@ -13,12 +13,24 @@ The router dynamically selects the optimal backend based on these factors, makin
 the "silicon choice" transparently and providing fallback mechanisms when needed.
 """
 
+import functools
+import heapq
 import json
 import logging
+import os
+import sys
 import time
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Set, Tuple, Any, Callable, TypedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Any, Callable, TypedDict
+
+try:
+    import orjson  # Optional: faster C JSON parser
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +39,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TesseractRouter")
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class BackendStatus(Enum):
     """Status of a backend hardware instance."""
@@ -37,19 +52,23 @@ class BackendStatus(Enum):
     @classmethod
     def from_str(cls, status_str: str) -> 'BackendStatus':
         """Convert a string to a BackendStatus enum."""
-        mapping = {
-            "healthy": cls.HEALTHY,
-            "degraded": cls.DEGRADED,
-            "down": cls.DOWN
-        }
-        return mapping.get(status_str.lower(), cls.DOWN)
+        return _STATUS_FROM_STR.get(status_str.lower(), cls.DOWN)
     
     def __str__(self) -> str:
         return self.value
 
 
+# Lookup table for BackendStatus.from_str, built once at import time
+_STATUS_FROM_STR: Dict[str, BackendStatus] = {status.value: status for status in BackendStatus}
+
+
+def _new_request_id() -> str:
+    """Generate a default request identifier from the current time."""
+    return f"req_{int(time.time())}"
+
+
 # Define data classes for type safety
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InferenceRequest:
     """
     Represents an AI model inference request to be routed to an appropriate backend.
@@ -68,7 +87,7 @@ class InferenceRequest:
     input_token_size: int
     required_latency_ms: int
     compliance_constraints: Set[str]
-    unique_id: str = field(default_factory=lambda: f"req_{int(time.time())}")
+    unique_id: str = field(default_factory=_new_request_id)
     priority: int = 1  # 1-5, with 1 being highest
     max_cost: Optional[float] = None
     prefer_cost_over_latency: bool = False
@@ -79,19 +98,22 @@ class InferenceRequest:
         # Convert compliance constraints to a set
         constraints = set(data.get('compliance_constraints', []))
         
+        # Only generate an id when the payload does not carry one
+        unique_id = data['unique_id'] if 'unique_id' in data else _new_request_id()
+        
         return cls(
             model_name=data.get('model_name', ''),
             input_token_size=data.get('input_token_size', 0),
             required_latency_ms=data.get('required_latency_ms', 0),
             compliance_constraints=constraints,
-            unique_id=data.get('unique_id', f"req_{int(time.time())}"),
+            unique_id=unique_id,
             priority=data.get('priority', 1),
             max_cost=data.get('max_cost'),
             prefer_cost_over_latency=data.get('prefer_cost_over_latency', False)
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Backend:
     """
     Represents a hardware backend capable of running AI model inference.
@@ -108,6 +130,8 @@ class Backend:
         max_token_size: Maximum token size this backend can handle
         current_load: Current load percentage (0-100)
         estimated_queue_time_ms: Estimated time a new request would spend in queue
+        supported_model_set: Frozen set of supported_models for membership tests
+        latency_per_token_ms: latency_ms spread over max_token_size, used for scoring
     """
     backend_id: str
     chip_type: str
@@ -116,16 +140,24 @@ class Backend:
     region: str
     supported_models: List[str]
     status: BackendStatus
-    compliance_tags: Set[str]
+    compliance_tags: FrozenSet[str]
     max_token_size: int
     current_load: float = 0.0
     estimated_queue_time_ms: int = 0
+    supported_model_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    latency_per_token_ms: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Membership data is fixed for a backend, so freeze it once on creation
+        self.compliance_tags = frozenset(self.compliance_tags)
+        self.supported_model_set = frozenset(self.supported_models)
+        self.latency_per_token_ms = self.latency_ms / max(1, self.max_token_size)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Backend':
         """Create a Backend from a dictionary."""
-        # Convert compliance tags to a set
-        tags = set(data.get('compliance_tags', []))
+        # Convert compliance tags to a frozen set
+        tags = frozenset(data.get('compliance_tags', []))
         
         return cls(
             backend_id=data.get('backend_id', ''),
@@ -142,13 +174,161 @@ class Backend:
         )
 
 
+# Compact integer codes for BackendStatus, used by the columnar backend view
+STATUS_CODES: Dict[BackendStatus, int] = {
+    BackendStatus.HEALTHY: 0,
+    BackendStatus.DEGRADED: 1,
+    BackendStatus.DOWN: 2
+}
+
+# A degraded backend runs 50% slower and its score is penalised by the same factor
+DEGRADED_LATENCY_FACTOR = 1.5
+DEGRADED_SCORE_FACTOR = 1.5
+
+
+class BackendColumns:
+    """
+    Column-oriented (structure-of-arrays) view of a list of backends.
+    
+    Holds the fields that the stats and filter hot paths scan in parallel
+    arrays indexed like the backend list, so those scans touch one compact
+    column instead of every Backend object.
+    
+    Attributes:
+        backend_id: Backend ID per backend
+        status: Status code per backend (see STATUS_CODES)
+        load: Current load percentage per backend
+        queue_time: Estimated queue time in ms per backend
+        latency: Base latency in ms per backend
+        cost: Cost per token per backend
+        max_tokens: Maximum token size per backend
+        region: Region per backend
+        chip_type: Chip type per backend
+        index: Mapping of backend_id to position in the columns
+        status_counts: Number of backends per status code, kept current
+            by set_status
+        by_model: Inverted index of model name to backend positions
+        by_compliance: Inverted index of compliance tag to backend positions
+    """
+    
+    CANDIDATE_CACHE_SIZE = 1024
+    NO_POSITIONS: FrozenSet[int] = frozenset()  # Shared result for unknown models/tags
+    
+    def __init__(self, backends: List[Backend]):
+        """Build the columns from a list of backends."""
+        self.backend_id = [b.backend_id for b in backends]
+        self.status = array('b', (STATUS_CODES[b.status] for b in backends))
+        self.load = array('d', (b.current_load for b in backends))
+        self.queue_time = array('d', (b.estimated_queue_time_ms for b in backends))
+        self.latency = array('d', (b.latency_ms for b in backends))
+        self.cost = array('d', (b.cost_per_token for b in backends))
+        self.max_tokens = array('d', (b.max_token_size for b in backends))
+        self.region = [b.region for b in backends]
+        self.chip_type = [b.chip_type for b in backends]
+        self.index: Dict[str, int] = {}
+        for i, b in enumerate(backends):
+            self.index.setdefault(b.backend_id, i)
+        
+        self.status_counts = [0] * len(STATUS_CODES)
+        for code in self.status:
+            self.status_counts[code] += 1
+        
+        self.by_model: Dict[str, Set[int]] = defaultdict(set)
+        self.by_compliance: Dict[str, Set[int]] = defaultdict(set)
+        for i, b in enumerate(backends):
+            for model in b.supported_models:
+                self.by_model[model].add(i)
+            for tag in b.compliance_tags:
+                self.by_compliance[tag].add(i)
+        
+        # Candidate sets per (model, compliance) request shape; the indexes
+        # above are fixed for the lifetime of the columns
+        self._candidate_cache: Dict[Tuple[str, FrozenSet[str]], FrozenSet[int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.status)
+    
+    def set_status(self, position: int, status: BackendStatus) -> None:
+        """Record a status change for the backend at the given position."""
+        code = STATUS_CODES[status]
+        self.status_counts[self.status[position]] -= 1
+        self.status_counts[code] += 1
+        self.status[position] = code
+    
+    def set_load(self, position: int, load: float, queue_time_ms: int) -> None:
+        """Record a load and queue time change for the backend at the given position."""
+        self.load[position] = load
+        self.queue_time[position] = queue_time_ms
+    
+    def candidates(self, model_name: str, compliance_constraints: Set[str]) -> FrozenSet[int]:
+        """Positions of backends that support the model and carry every required tag."""
+        key = (model_name, frozenset(compliance_constraints))
+        cached = self._candidate_cache.get(key)
+        if cached is None:
+            model_positions = self.by_model.get(model_name, self.NO_POSITIONS)
+            cached = frozenset(model_positions.intersection(
+                *(self.by_compliance.get(tag, self.NO_POSITIONS) for tag in compliance_constraints)
+            ))
+            # Request shapes come from callers, so keep the cache bounded
+            if len(self._candidate_cache) >= self.CANDIDATE_CACHE_SIZE:
+                self._candidate_cache.clear()
+            self._candidate_cache[key] = cached
+        return cached
+    
+    def within_limits(self, positions: FrozenSet[int], request: InferenceRequest,
+                      latencies: Dict[str, int]) -> Set[int]:
+        """
+        Subset of positions whose token, latency and cost limits admit the request.
+        
+        Mirrors filter_by_token_size, filter_by_latency and filter_by_cost using
+        column data only, so admitted backends never touch the filter chain.
+        
+        Args:
+            positions: Backend positions to screen
+            request: The inference request
+            latencies: Backend ID -> network latency from the user's region
+        """
+        degraded_code = STATUS_CODES[BackendStatus.DEGRADED]
+        degraded_factor = DEGRADED_LATENCY_FACTOR
+        token_size = request.input_token_size
+        required_latency = request.required_latency_ms
+        max_cost = request.max_cost
+        status, latency, queue_time = self.status, self.latency, self.queue_time
+        
+        admitted = set()
+        for i in positions:
+            if token_size > self.max_tokens[i]:
+                continue
+            total_latency = latency[i] + latencies[self.backend_id[i]] + queue_time[i]
+            if status[i] == degraded_code:
+                total_latency = int(total_latency * degraded_factor)
+            if total_latency > required_latency:
+                continue
+            if max_cost is not None and self.cost[i] * token_size > max_cost:
+                continue
+            admitted.add(i)
+        return admitted
+
+
+class FilterCategory(Enum):
+    """Which compatibility check caused a backend to be filtered out."""
+    STATUS = "status"
+    MODEL_UNSUPPORTED = "model"
+    TOKEN_LIMIT = "token_size"
+    COMPLIANCE = "compliance"
+    LATENCY = "latency"
+    COST = "cost"
+    BACKEND_FAILURE = "backend_failure"
+
+
 class FilterReason(TypedDict):
     """Represents a reason why a backend was filtered out."""
     backend: Backend
     reason: str
+    category: FilterCategory
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RoutingResult:
     """
     Result of a routing decision, including the selected backend and related metadata.
@@ -243,15 +423,30 @@ class RoutingResult:
 class NetworkLatencyMap:
     """Manages network latency data between regions."""
     
+    # Region names can come from clients, so the lookup memo is bounded
+    LATENCY_CACHE_SIZE = 256
+    
     def __init__(self, latency_file: Optional[str] = None):
         """Initialize with an optional latency data file."""
         self.latency_map = {}
+        # Memo of resolved region-pair lookups
+        self._cached_latency = functools.lru_cache(maxsize=self.LATENCY_CACHE_SIZE)(self._lookup_latency)
         if latency_file:
             self.load_latency_data(latency_file)
         else:
             # Initialize with some default values
             self._initialize_default_latencies()
     
+    def __getstate__(self) -> Dict[str, Any]:
+        # The lookup memo wraps a bound method and cannot be pickled
+        state = self.__dict__.copy()
+        del state["_cached_latency"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cached_latency = functools.lru_cache(maxsize=self.LATENCY_CACHE_SIZE)(self._lookup_latency)
+    
     def _initialize_default_latencies(self):
         """Initialize with reasonable default latencies based on geographic proximity."""
         # Define some common regions
@@ -261,6 +456,8 @@ class NetworkLatencyMap:
             "ap-northeast-1", "ap-southeast-1", "global"
         ]
         
+        self._cached_latency.cache_clear()
+        
         # Create empty map structure
         for r1 in regions:
             self.latency_map[r1] = {}
@@ -320,6 +517,7 @@ class NetworkLatencyMap:
         try:
             with open(latency_file, 'r') as f:
                 self.latency_map = json.load(f)
+            self._cached_latency.cache_clear()
             logger.info(f"Loaded network latency data from {latency_file}")
         except Exception as e:
             logger.error(f"Failed to load latency data from {latency_file}: {e}")
@@ -327,6 +525,10 @@ class NetworkLatencyMap:
     
     def get_latency(self, from_region: str, to_region: str) -> int:
         """Get the network latency between two regions in milliseconds."""
+        return self._cached_latency(from_region, to_region)
+    
+    def _lookup_latency(self, from_region: str, to_region: str) -> int:
+        """Resolve the latency between two regions from the map (uncached)."""
         # If regions match, return minimal latency
         if from_region == to_region:
             return 1
@@ -345,6 +547,7 @@ class NetworkLatencyMap:
             self.latency_map[from_region] = {}
         
         self.latency_map[from_region][to_region] = latency_ms
+        self._cached_latency.cache_clear()
         logger.debug(f"Updated latency: {from_region} -> {to_region} = {latency_ms}ms")
 
 
@@ -354,8 +557,9 @@ class BackendScorer:
     @staticmethod
     def calculate_base_score(backend: Backend, request: InferenceRequest) -> float:
         """Calculate the base score for a backend."""
-        # Base score is a product of latency and cost per token
-        return backend.latency_ms * backend.cost_per_token
+        # Base score is the estimated processing time for the request's tokens
+        # (per-token latency times token count) weighted by cost per token
+        return backend.latency_per_token_ms * max(1, request.input_token_size) * backend.cost_per_token
     
     @staticmethod
     def apply_health_adjustment(score: float, backend: Backend) -> float:
@@ -363,7 +567,7 @@ class BackendScorer:
         if backend.status == BackendStatus.DOWN:
             return float('inf')
         elif backend.status == BackendStatus.DEGRADED:
-            return score * 1.5
+            return score * DEGRADED_SCORE_FACTOR
         else:  # HEALTHY
             return score
     
@@ -415,7 +619,7 @@ class BackendScorer:
         # Calculate total expected latency
         total_latency = backend.latency_ms + network_latency
         if backend.status == BackendStatus.DEGRADED:
-            total_latency = int(total_latency * 1.5)  # 50% slower when degraded
+            total_latency = int(total_latency * DEGRADED_LATENCY_FACTOR)  # 50% slower when degraded
         
         # Add estimated queue time
         total_latency += backend.estimated_queue_time_ms
@@ -424,6 +628,63 @@ class BackendScorer:
         total_cost = backend.cost_per_token * request.input_token_size
         
         return load_adjusted, total_latency, total_cost
+    
+    @staticmethod
+    def score_backends(request: InferenceRequest, backends: List[Backend],
+                       network_latencies: List[int]) -> List[Tuple[Backend, float, int, float]]:
+        """
+        Score a batch of backends for a single request.
+        
+        Produces the same values as calling score_backend per backend, but the
+        request-level factors are computed once and the per-backend adjustments
+        are inlined to avoid the method-call chain inside the loop.
+        
+        Args:
+            request: The inference request
+            backends: Backends to score
+            network_latencies: Network latency per backend, aligned with backends
+            
+        Returns:
+            List of (backend, score, total_latency, total_cost) tuples in input order
+        """
+        priority_factor = 1.0 / request.priority
+        prefer_cost = request.prefer_cost_over_latency
+        token_size = request.input_token_size
+        score_tokens = max(1, token_size)
+        down = BackendStatus.DOWN
+        degraded = BackendStatus.DEGRADED
+        degraded_score_factor = DEGRADED_SCORE_FACTOR
+        degraded_latency_factor = DEGRADED_LATENCY_FACTOR
+        
+        scored = []
+        for backend, network_latency in zip(backends, network_latencies):
+            status = backend.status
+            cost_per_token = backend.cost_per_token
+            queue_time_ms = backend.estimated_queue_time_ms
+            is_degraded = status == degraded
+            
+            # Same sequence of adjustments as score_backend
+            score = backend.latency_per_token_ms * score_tokens * cost_per_token
+            if status == down:
+                score = float('inf')
+            elif is_degraded:
+                score = score * degraded_score_factor
+            score = score * priority_factor
+            if prefer_cost:
+                score = score * (cost_per_token * 1000)
+            if queue_time_ms > 100:
+                score = score * (1 + (queue_time_ms / 100))
+            else:
+                score = score * (1 + (backend.current_load / 100))
+            
+            total_latency = backend.latency_ms + network_latency
+            if is_degraded:
+                total_latency = int(total_latency * degraded_latency_factor)
+            total_latency += queue_time_ms
+            
+            scored.append((backend, score, total_latency, cost_per_token * token_size))
+        
+        return scored
 
 
 class BackendFilter:
@@ -439,7 +700,7 @@ class BackendFilter:
     @staticmethod
     def filter_by_model(backend: Backend, request: InferenceRequest) -> Optional[str]:
         """Filter backends by model compatibility."""
-        if request.model_name not in backend.supported_models:
+        if request.model_name not in backend.supported_model_set:
             return f"Model {request.model_name} not supported"
         return None
     
@@ -477,7 +738,7 @@ class BackendFilter:
         
         # For degraded backends, estimate worse performance
         if backend.status == BackendStatus.DEGRADED:
-            total_latency = int(total_latency * 1.5)  # 50% slower
+            total_latency = int(total_latency * DEGRADED_LATENCY_FACTOR)  # 50% slower
         
         # Check against requirement
         if total_latency > request.required_latency_ms:
@@ -495,36 +756,88 @@ class BackendFilter:
         return None
     
     @classmethod
-    def apply_filters(cls, backend: Backend, request: InferenceRequest, 
-                     network_latency: int = 0) -> Optional[str]:
+    def check_filters(cls, backend: Backend, request: InferenceRequest,
+                      network_latency: int = 0) -> Optional[Tuple[FilterCategory, str]]:
         """
-        Apply all filters and return reason for incompatibility if any.
+        Apply all filters and return the category and reason of the first failure, if any.
+        
+        The order also decides which reason is reported for a backend that fails
+        several checks, so it stays fixed rather than being tuned for speed.
+        The predicates are evaluated inline; the individual filter method is only
+        called for the first failing check, to produce its reason.
         
         Args:
             backend: The backend to evaluate
             request: The inference request
             network_latency: Network latency between user and backend
         """
-        filters = [
-            cls.filter_by_status,
-            cls.filter_by_model,
-            cls.filter_by_token_size, 
-            cls.filter_by_compliance,
-            lambda b, r: cls.filter_by_latency(b, r, network_latency),
-            cls.filter_by_cost
-        ]
+        if backend.status == BackendStatus.DOWN:
+            return FilterCategory.STATUS, cls.filter_by_status(backend, request)
+        if request.model_name not in backend.supported_model_set:
+            return FilterCategory.MODEL_UNSUPPORTED, cls.filter_by_model(backend, request)
+        if request.input_token_size > backend.max_token_size:
+            return FilterCategory.TOKEN_LIMIT, cls.filter_by_token_size(backend, request)
+        if not request.compliance_constraints.issubset(backend.compliance_tags):
+            return FilterCategory.COMPLIANCE, cls.filter_by_compliance(backend, request)
+        return cls._check_latency_and_cost(backend, request, network_latency)
+    
+    @classmethod
+    def check_limits(cls, backend: Backend, request: InferenceRequest,
+                     network_latency: int = 0) -> Optional[Tuple[FilterCategory, str]]:
+        """
+        Apply only the token size, latency and cost filters, in chain order.
         
-        for filter_func in filters:
-            reason = filter_func(backend, request)
-            if reason:
-                return reason
+        For backends already known to be up, to support the model and to
+        carry the required compliance tags, this gives the same result as
+        check_filters without re-running those membership checks.
         
+        Args:
+            backend: The backend to evaluate
+            request: The inference request
+            network_latency: Network latency between user and backend
+        """
+        if request.input_token_size > backend.max_token_size:
+            return FilterCategory.TOKEN_LIMIT, cls.filter_by_token_size(backend, request)
+        return cls._check_latency_and_cost(backend, request, network_latency)
+    
+    @classmethod
+    def _check_latency_and_cost(cls, backend: Backend, request: InferenceRequest,
+                                network_latency: int) -> Optional[Tuple[FilterCategory, str]]:
+        """Inline form of filter_by_latency followed by filter_by_cost."""
+        total_latency = backend.latency_ms + network_latency + backend.estimated_queue_time_ms
+        if backend.status == BackendStatus.DEGRADED:
+            total_latency = int(total_latency * DEGRADED_LATENCY_FACTOR)
+        if total_latency > request.required_latency_ms:
+            return FilterCategory.LATENCY, cls.filter_by_latency(backend, request, network_latency)
+        max_cost = request.max_cost
+        if max_cost is not None and backend.cost_per_token * request.input_token_size > max_cost:
+            return FilterCategory.COST, cls.filter_by_cost(backend, request)
         return None
+    
+    @classmethod
+    def apply_filters(cls, backend: Backend, request: InferenceRequest, 
+                     network_latency: int = 0) -> Optional[str]:
+        """
+        Apply all filters and return reason for incompatibility if any.
+        
+        Args:
+            backend: The backend to evaluate
+            request: The inference request
+            network_latency: Network latency between user and backend
+        """
+        failure = cls.check_filters(backend, request, network_latency)
+        return failure[1] if failure else None
 
 
 class TesseractRouter:
     """The main routing class that selects the optimal backend for inference requests."""
     
+    # Number of alternative backends listed alongside a recommendation
+    MAX_ALTERNATIVES = 2
+    
+    # Batches smaller than this are routed serially by route_batch_parallel
+    PARALLEL_BATCH_THRESHOLD = 64
+    
     def __init__(self, backends_file: str = "models/backends.json", 
                 latency_file: Optional[str] = None, 
                 user_region: str = "us-east-1"):
@@ -536,12 +849,61 @@ class TesseractRouter:
             latency_file: Optional path to network latency data
             user_region: Default region for user requests
         """
+        self._init_state(latency_file, user_region)
+        self.load_backends(backends_file)
+        logger.info(f"Tesseract Router initialized with {len(self.backends)} backends")
+    
+    @classmethod
+    def from_backend_dicts(cls, backend_dicts: List[Dict[str, Any]],
+                           latency_file: Optional[str] = None,
+                           user_region: str = "us-east-1") -> 'TesseractRouter':
+        """
+        Create a router from in-memory backend definitions instead of a file.
+        
+        Args:
+            backend_dicts: Backend definitions in the backends file format
+            latency_file: Optional path to network latency data
+            user_region: Default region for user requests
+        """
+        router = cls.__new__(cls)
+        router._init_state(latency_file, user_region)
+        router._set_backends([Backend.from_dict(backend) for backend in backend_dicts])
+        logger.info(f"Tesseract Router initialized with {len(router.backends)} backends")
+        return router
+    
+    def _init_state(self, latency_file: Optional[str], user_region: str) -> None:
+        """Set up everything except the backends themselves."""
         self.backends: List[Backend] = []
+        self._columns = BackendColumns([])
         self.network_latency = NetworkLatencyMap(latency_file)
         self.user_region = user_region
         self._last_scoring_result = None  # Store the most recent scoring result
-        self.load_backends(backends_file)
-        logger.info(f"Tesseract Router initialized with {len(self.backends)} backends")
+        # (considered_backends, region, backend_version, scored) of the most recent
+        # decision, so a fallback for that decision can skip re-scoring
+        self._last_decision: Optional[Tuple[List[Backend], str, int, List[Tuple[Backend, float, int, float]]]] = None
+        self._backend_version = 0  # Bumped whenever backend or latency state changes
+        # Stats results keyed by name, each stored with the version it was computed at
+        self._stats_cache: Dict[str, Tuple[int, Any]] = {}
+        # Per-instance memo of recommendation profiles, cleared on any backend change
+        self._compute_recommendations = functools.lru_cache(maxsize=512)(
+            self._build_recommendations
+        )
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Caches are rebuilt on unpickling; the recommendation memo wraps a
+        # bound method and cannot be pickled
+        state = self.__dict__.copy()
+        del state["_compute_recommendations"]
+        state["_last_scoring_result"] = None
+        state["_last_decision"] = None
+        state["_stats_cache"] = {}
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compute_recommendations = functools.lru_cache(maxsize=512)(
+            self._build_recommendations
+        )
     
     def load_backends(self, backends_file: str) -> None:
         """Load backend configurations from a JSON file."""
@@ -549,12 +911,25 @@ class TesseractRouter:
             with open(backends_file, 'r') as f:
                 backends_data = json.load(f)
             
-            self.backends = [Backend.from_dict(backend) for backend in backends_data]
-            logger.info(f"Loaded {len(self.backends)} backends from {backends_file}")
+            backends = [Backend.from_dict(backend) for backend in backends_data]
+            logger.info(f"Loaded {len(backends)} backends from {backends_file}")
         except Exception as e:
             logger.error(f"Failed to load backends from {backends_file}: {e}")
             # Initialize with empty list if file can't be loaded
-            self.backends = []
+            backends = []
+        
+        self._set_backends(backends)
+    
+    def _set_backends(self, backends: List[Backend]) -> None:
+        """Replace the backend list and rebuild everything derived from it."""
+        self.backends = backends
+        self._columns = BackendColumns(self.backends)
+        self._invalidate_caches()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop any cached results derived from backend or latency state."""
+        self._backend_version += 1
+        self._compute_recommendations.cache_clear()
     
     def set_user_region(self, region: str) -> None:
         """Set the current user's region for latency calculations."""
@@ -572,10 +947,53 @@ class TesseractRouter:
         """
         # Use provided user region or default
         region = user_region if user_region else self.user_region
+        
+        # Resolve network latency to every backend once for this request
+        return self._route(request, region, self._latency_for_request(region))
+    
+    def route_batch(self, requests: List[InferenceRequest],
+                    user_region: Optional[str] = None) -> List[RoutingResult]:
+        """
+        Route a batch of inference requests from the same region in one pass.
+        
+        Per-backend state shared by the whole batch (network latencies from the
+        region, the columnar backend view and its candidate indexes) is resolved
+        once rather than per request. Requests are bucketed by their model and
+        compliance constraints, and the model/compliance candidate set is looked
+        up once per bucket. Results are returned in input order.
+        
+        Args:
+            requests: The inference requests to route
+            user_region: Optional region of the user, applied to every request
+        """
+        region = user_region if user_region else self.user_region
+        latencies = self._latency_for_request(region)
+        
+        # Candidate sets per (model, compliance) bucket, looked up once per bucket
+        buckets: Dict[Tuple[str, FrozenSet[str]], FrozenSet[int]] = {}
+        results = []
+        for request in requests:
+            key = (request.model_name, frozenset(request.compliance_constraints))
+            candidates = buckets.get(key)
+            if candidates is None:
+                candidates = buckets[key] = self._columns.candidates(*key)
+            results.append(self._route(request, region, latencies, candidates))
+        return results
+    
+    def _route(self, request: InferenceRequest, region: str,
+               latencies: Dict[str, int],
+               candidates: Optional[FrozenSet[int]] = None) -> RoutingResult:
+        """
+        Route a request given the backend_id -> network latency map for its region.
+        
+        candidates, if given, is the request's model/compliance candidate set
+        from BackendColumns.candidates.
+        """
         logger.info(f"Routing request {request.unique_id} for model {request.model_name} from {region}")
         
         # Step 1: Filter backends by compatibility and compliance
-        compatible_backends, filtered_out = self._filter_compatible_backends(request, region)
+        compatible_backends, filtered_out = self._filter_compatible_backends(
+            request, region, latencies, candidates)
         
         if not compatible_backends:
             logger.warning(f"No compatible backends found for request {request.unique_id}")
@@ -591,7 +1009,7 @@ class TesseractRouter:
             )
         
         # Step 2: Score and rank the compatible backends
-        scored_backends = self._score_backends(request, compatible_backends, region)
+        scored_backends = self._score_backends(request, compatible_backends, region, latencies)
         
         # Step 3: Select the best backend
         best_backend, best_score, total_latency, total_cost = scored_backends[0]
@@ -603,28 +1021,98 @@ class TesseractRouter:
                     f"for request {request.unique_id} with score {best_score:.4f}, "
                     f"latency {total_latency}ms")
         
+        considered_backends = [backend for backend, _, _, _ in scored_backends]
+        self._last_decision = (considered_backends, region, self._backend_version, scored_backends)
+        
         return RoutingResult(
             request=request,
             selected_backend=best_backend,
             score=best_score,
-            considered_backends=[backend for backend, _, _, _ in scored_backends],
+            considered_backends=considered_backends,
             filtered_out=filtered_out,
             final_latency_ms=total_latency,
             final_cost=total_cost,
             sla_met=sla_met
         )
     
+    def route_batch_parallel(self, requests: List[InferenceRequest],
+                             user_region: Optional[str] = None,
+                             max_workers: Optional[int] = None) -> List[RoutingResult]:
+        """
+        Route a batch of requests across worker processes.
+        
+        The batch is split into one contiguous chunk per worker and each worker
+        routes its chunk with route_batch on a pickled copy of the router. The
+        returned results refer to this router's Backend objects and to the input
+        requests, in input order. Batches below PARALLEL_BATCH_THRESHOLD, or a
+        single worker, are routed serially in this process. The parallel path
+        does not update the last scoring result.
+        
+        Args:
+            requests: The inference requests to route
+            user_region: Optional region of the user, applied to every request
+            max_workers: Number of worker processes (os.cpu_count() if None)
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 1 or len(requests) < self.PARALLEL_BATCH_THRESHOLD:
+            return self.route_batch(requests, user_region)
+        
+        region = user_region if user_region else self.user_region
+        chunk_size = -(-len(requests) // max_workers)
+        chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+        
+        results: List[RoutingResult] = []
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            for worker_backends, chunk_results in pool.map(
+                    _route_batch_chunk, [self] * len(chunks), chunks, [region] * len(chunks)):
+                # Map the workers' unpickled Backend copies back onto our own
+                originals = {id(copy): backend for copy, backend in zip(worker_backends, self.backends)}
+                for result in chunk_results:
+                    result.selected_backend = originals.get(id(result.selected_backend))
+                    result.considered_backends = [originals[id(b)] for b in result.considered_backends]
+                    for entry in result.filtered_out:
+                        entry["backend"] = originals[id(entry["backend"])]
+                results.extend(chunk_results)
+        
+        for request, result in zip(requests, results):
+            result.request = request
+        return results
+    
+    def route_requests(self, requests: List[InferenceRequest],
+                       user_region: Optional[str] = None,
+                       max_workers: Optional[int] = None) -> List[RoutingResult]:
+        """
+        Route a batch of independent inference requests.
+        
+        Requests are dispatched to a thread pool and the results are returned
+        in the same order as the input. Pass max_workers=1 to route serially.
+        
+        Args:
+            requests: The inference requests to route
+            user_region: Optional region of the user, applied to every request
+            max_workers: Maximum number of worker threads (executor default if None)
+        """
+        if max_workers == 1 or len(requests) <= 1:
+            return [self.route_request(request, user_region) for request in requests]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda request: self.route_request(request, user_region), requests))
+    
     def update_backend_status(self, backend_id: str, new_status: str) -> bool:
         """
         Update the status of a backend.
         Returns True if successful, False if backend not found.
         """
-        for backend in self.backends:
-            if backend.backend_id == backend_id:
-                old_status = backend.status
-                backend.status = BackendStatus.from_str(new_status)
-                logger.info(f"Backend {backend_id} status changed from {old_status} to {backend.status}")
-                return True
+        position = self._columns.index.get(backend_id)
+        if position is not None:
+            backend = self.backends[position]
+            old_status = backend.status
+            backend.status = BackendStatus.from_str(new_status)
+            self._columns.set_status(position, backend.status)
+            self._invalidate_caches()
+            logger.info(f"Backend {backend_id} status changed from {old_status} to {backend.status}")
+            return True
         
         logger.warning(f"Backend {backend_id} not found, cannot update status")
         return False
@@ -634,12 +1122,15 @@ class TesseractRouter:
         Update the load and queue time metrics for a backend.
         Returns True if successful, False if backend not found.
         """
-        for backend in self.backends:
-            if backend.backend_id == backend_id:
-                backend.current_load = max(0.0, min(100.0, load))  # Ensure between 0-100%
-                backend.estimated_queue_time_ms = max(0, queue_time_ms)
-                logger.debug(f"Backend {backend_id} load updated to {load}%, queue {queue_time_ms}ms")
-                return True
+        position = self._columns.index.get(backend_id)
+        if position is not None:
+            backend = self.backends[position]
+            backend.current_load = max(0.0, min(100.0, load))  # Ensure between 0-100%
+            backend.estimated_queue_time_ms = max(0, queue_time_ms)
+            self._columns.set_load(position, backend.current_load, backend.estimated_queue_time_ms)
+            self._invalidate_caches()
+            logger.debug(f"Backend {backend_id} load updated to {load}%, queue {queue_time_ms}ms")
+            return True
         
         logger.warning(f"Backend {backend_id} not found, cannot update load metrics")
         return False
@@ -647,6 +1138,7 @@ class TesseractRouter:
     def update_network_latency(self, from_region: str, to_region: str, latency_ms: int) -> None:
         """Update network latency data between two regions."""
         self.network_latency.update_latency(from_region, to_region, latency_ms)
+        self._invalidate_caches()
     
     def simulate_backend_degradation(self) -> List[Tuple[str, str, str]]:
         """
@@ -656,7 +1148,7 @@ class TesseractRouter:
         import random
         
         changes = []
-        for backend in self.backends:
+        for position, backend in enumerate(self.backends):
             # 10% chance to change status
             if random.random() < 0.1:
                 old_status = backend.status
@@ -673,12 +1165,17 @@ class TesseractRouter:
                     new_status = BackendStatus.DEGRADED if random.random() < 0.7 else BackendStatus.HEALTHY
                 
                 backend.status = new_status
+                self._columns.set_status(position, new_status)
                 changes.append((backend.backend_id, str(old_status), str(new_status)))
                 logger.info(f"Backend {backend.backend_id} status changed from {old_status} to {new_status}")
                 
                 # Also simulate load changes
                 backend.current_load = random.uniform(10.0, 90.0)
                 backend.estimated_queue_time_ms = int(backend.current_load * random.uniform(0.5, 2.0))
+                self._columns.set_load(position, backend.current_load, backend.estimated_queue_time_ms)
+        
+        if changes:
+            self._invalidate_caches()
         
         return changes
     
@@ -704,54 +1201,49 @@ class TesseractRouter:
             }
         return stats
     
+    def _cached_stats(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a stats result, recomputing it only if backends changed since it was cached."""
+        cached = self._stats_cache.get(name)
+        if cached is not None and cached[0] == self._backend_version:
+            return cached[1]
+        
+        result = compute()
+        self._stats_cache[name] = (self._backend_version, result)
+        return result
+    
     def get_region_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         Get statistics grouped by region.
         
+        The result is cached until backend state changes, so callers must
+        treat it as read-only.
+        
         Returns:
             Dictionary mapping region to stats dictionary
         """
-        stats = {}
-        
-        # Initialize regions
+        return self._cached_stats("region", self._compute_region_stats)
+    
+    def _compute_region_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Compute per-region statistics (uncached)."""
+        # Group backends by region, keeping first-seen region order
+        backends_by_region: Dict[str, List[Backend]] = defaultdict(list)
         for backend in self.backends:
-            if backend.region not in stats:
-                stats[backend.region] = {
-                    "backend_count": 0,
-                    "healthy_backends": 0,
-                    "degraded_backends": 0,
-                    "down_backends": 0,
-                    "avg_load": 0.0,
-                    "chip_types": set(),
-                    "supported_models": set(),
-                    "compliance_tags": set()
-                }
+            backends_by_region[backend.region].append(backend)
         
-        # Collect stats
-        for backend in self.backends:
-            region_stats = stats[backend.region]
-            region_stats["backend_count"] += 1
-            
-            if backend.status == BackendStatus.HEALTHY:
-                region_stats["healthy_backends"] += 1
-            elif backend.status == BackendStatus.DEGRADED:
-                region_stats["degraded_backends"] += 1
-            else:  # DOWN
-                region_stats["down_backends"] += 1
-            
-            region_stats["avg_load"] += backend.current_load
-            region_stats["chip_types"].add(backend.chip_type)
-            region_stats["supported_models"].update(backend.supported_models)
-            region_stats["compliance_tags"].update(backend.compliance_tags)
-        
-        # Calculate averages and convert sets to lists
-        for region, region_stats in stats.items():
-            if region_stats["backend_count"] > 0:
-                region_stats["avg_load"] /= region_stats["backend_count"]
-            
-            region_stats["chip_types"] = list(region_stats["chip_types"])
-            region_stats["supported_models"] = list(region_stats["supported_models"])
-            region_stats["compliance_tags"] = list(region_stats["compliance_tags"])
+        stats = {}
+        for region, backends in backends_by_region.items():
+            backend_count = len(backends)
+            status_counts = Counter(backend.status for backend in backends)
+            stats[region] = {
+                "backend_count": backend_count,
+                "healthy_backends": status_counts[BackendStatus.HEALTHY],
+                "degraded_backends": status_counts[BackendStatus.DEGRADED],
+                "down_backends": status_counts[BackendStatus.DOWN],
+                "avg_load": sum(backend.current_load for backend in backends) / backend_count,
+                "chip_types": list({backend.chip_type for backend in backends}),
+                "supported_models": list(set().union(*(b.supported_models for b in backends))),
+                "compliance_tags": list(set().union(*(b.compliance_tags for b in backends)))
+            }
         
         return stats
     
@@ -759,29 +1251,33 @@ class TesseractRouter:
         """
         Get global statistics about the routing system.
         
+        The result is cached until backend state changes, so callers must
+        treat it as read-only.
+        
         Returns:
             Dictionary with global stats
         """
-        total_backends = len(self.backends)
-        healthy_backends = sum(1 for b in self.backends if b.status == BackendStatus.HEALTHY)
-        degraded_backends = sum(1 for b in self.backends if b.status == BackendStatus.DEGRADED)
-        down_backends = sum(1 for b in self.backends if b.status == BackendStatus.DOWN)
+        return self._cached_stats("global", self._compute_global_routing_stats)
+    
+    def _compute_global_routing_stats(self) -> Dict[str, Any]:
+        """Compute global routing statistics (uncached)."""
+        columns = self._columns
+        total_backends = len(columns)
+        healthy_backends, degraded_backends, down_backends = (
+            columns.status_counts[STATUS_CODES[status]]
+            for status in (BackendStatus.HEALTHY, BackendStatus.DEGRADED, BackendStatus.DOWN)
+        )
         
         # Get unique regions, chip types, and models
-        regions = set(b.region for b in self.backends)
-        chip_types = set(b.chip_type for b in self.backends)
-        models = set()
-        for backend in self.backends:
-            models.update(backend.supported_models)
-        
-        # Get average load across all healthy backends
-        avg_load = 0.0
-        healthy_count = 0
-        for backend in self.backends:
-            if backend.status != BackendStatus.DOWN:
-                avg_load += backend.current_load
-                healthy_count += 1
-        
+        regions = set(columns.region)
+        chip_types = set(columns.chip_type)
+        models = set().union(*(backend.supported_models for backend in self.backends))
+        
+        # Get average load across all backends that are not down
+        down_code = STATUS_CODES[BackendStatus.DOWN]
+        avg_load = sum(load for load, status in zip(columns.load, columns.status)
+                       if status != down_code)
+        healthy_count = total_backends - down_backends
         if healthy_count > 0:
             avg_load /= healthy_count
         
@@ -812,8 +1308,20 @@ class TesseractRouter:
             from_region: Source region of request
             
         Returns:
-            Dictionary with recommendations
+            Dictionary with recommendations. Results are memoized per request
+            profile, so callers must treat the returned dictionary as read-only.
         """
+        # Keyed on the constraints in the caller's order, since they are
+        # echoed back in the request profile
+        return self._compute_recommendations(
+            model_name, required_latency_ms,
+            tuple(compliance_constraints), from_region
+        )
+    
+    def _build_recommendations(self, model_name: str, required_latency_ms: int,
+                               compliance_constraints: Tuple[str, ...],
+                               from_region: str) -> Dict[str, Any]:
+        """Compute recommendations for a hashable request profile (uncached)."""
         # Create a test request
         request = InferenceRequest(
             model_name=model_name,
@@ -823,39 +1331,42 @@ class TesseractRouter:
             priority=1
         )
         
-        # Get a routing result
-        result = self.route_request(request, from_region)
+        # Only the best backend and its alternatives are reported, so rank just
+        # those instead of routing (and fully sorting) the request
+        latencies = self._latency_for_request(from_region)
+        compatible_backends, filtered_out = self._filter_compatible_backends(
+            request, from_region, latencies
+        )
+        top_backends = self._score_backends(
+            request, compatible_backends, from_region, latencies,
+            k=self.MAX_ALTERNATIVES + 1
+        ) if compatible_backends else []
         
         # Build recommendations based on the result
         recommendations = {
-            "can_route": result.selected_backend is not None,
-            "sla_met": result.sla_met,
+            "can_route": bool(top_backends),
+            "sla_met": bool(top_backends) and top_backends[0][2] <= required_latency_ms,
             "request_profile": {
                 "model": model_name,
                 "required_latency_ms": required_latency_ms,
-                "compliance_constraints": compliance_constraints,
+                "compliance_constraints": list(compliance_constraints),
                 "from_region": from_region
             }
         }
         
-        if result.selected_backend:
+        if top_backends:
+            best_backend, _, best_latency, best_cost = top_backends[0]
             recommendations["recommended_backend"] = {
-                "backend_id": result.selected_backend.backend_id,
-                "chip_type": result.selected_backend.chip_type,
-                "region": result.selected_backend.region,
-                "estimated_latency_ms": result.final_latency_ms,
-                "estimated_cost": result.final_cost
+                "backend_id": best_backend.backend_id,
+                "chip_type": best_backend.chip_type,
+                "region": best_backend.region,
+                "estimated_latency_ms": best_latency,
+                "estimated_cost": best_cost
             }
             
-            # Add alternative backends if any
+            # Add alternative backends if any; they were scored with the rest
             alternatives = []
-            for backend in result.considered_backends[1:3]:  # Top 3 alternatives
-                # Calculate latency and cost
-                network_latency = self.network_latency.get_latency(from_region, backend.region)
-                _, total_latency, total_cost = BackendScorer.score_backend(
-                    backend, request, network_latency
-                )
-                
+            for backend, _, total_latency, total_cost in top_backends[1:]:
                 alternatives.append({
                     "backend_id": backend.backend_id,
                     "chip_type": backend.chip_type,
@@ -868,74 +1379,118 @@ class TesseractRouter:
             recommendations["alternatives"] = alternatives
         
         # Analyze why routing might have failed
-        if not result.selected_backend:
-            reasons = {}
-            for filtered in result.filtered_out:
-                reason = filtered["reason"]
-                if reason in reasons:
-                    reasons[reason] += 1
-                else:
-                    reasons[reason] = 1
+        if not top_backends:
+            reasons = Counter(filtered["reason"] for filtered in filtered_out)
+            categories = {filtered["category"] for filtered in filtered_out}
             
             recommendations["routing_failure_analysis"] = {
-                "filtered_backends_count": len(result.filtered_out),
-                "common_reasons": reasons
+                "filtered_backends_count": len(filtered_out),
+                "common_reasons": dict(reasons)
             }
             
             # Suggest ways to fix the issue
             suggestions = []
-            if "Model" in str(reasons):
+            if FilterCategory.MODEL_UNSUPPORTED in categories:
                 suggestions.append("Request a different supported model")
-            if "latency" in str(reasons):
+            if FilterCategory.LATENCY in categories:
                 suggestions.append("Increase latency SLA or request from a region closer to compatible backends")
-            if "compliance" in str(reasons):
+            if FilterCategory.COMPLIANCE in categories:
                 suggestions.append("Adjust compliance requirements if possible")
             
             recommendations["suggestions"] = suggestions
         
         return recommendations
     
+    def _latency_for_request(self, user_region: str,
+                             backends: Optional[List[Backend]] = None) -> Dict[str, int]:
+        """Map each backend_id to the network latency from the user's region."""
+        get_latency = self.network_latency.get_latency
+        if backends is None:
+            backends = self.backends
+        return {b.backend_id: get_latency(user_region, b.region) for b in backends}
+    
     def _filter_compatible_backends(self, request: InferenceRequest, 
-                                  user_region: str) -> Tuple[List[Backend], List[FilterReason]]:
+                                  user_region: str,
+                                  latencies: Optional[Dict[str, int]] = None,
+                                  candidates: Optional[FrozenSet[int]] = None
+                                  ) -> Tuple[List[Backend], List[FilterReason]]:
         """
         Filter backends based on compatibility with the request.
         Returns a tuple of (compatible_backends, filtered_out_backends_with_reasons)
+        
+        Args:
+            request: The inference request
+            user_region: Region of the user
+            latencies: Optional precomputed backend_id -> network latency map
+            candidates: Optional precomputed model/compliance candidate positions
         """
+        if latencies is None:
+            latencies = self._latency_for_request(user_region)
+        
         compatible_backends = []
         filtered_out = []
-        
-        for backend in self.backends:
-            # Calculate network latency between user and this backend
-            network_latency = self.network_latency.get_latency(user_region, backend.region)
-            
-            # Apply all filters
-            reason = BackendFilter.apply_filters(backend, request, network_latency)
+        columns = self._columns
+        down_code = STATUS_CODES[BackendStatus.DOWN]
+        model_positions = columns.by_model.get(request.model_name, columns.NO_POSITIONS)
+        if candidates is None:
+            candidates = columns.candidates(request.model_name, request.compliance_constraints)
+        admitted = columns.within_limits(candidates, request, latencies)
+        
+        for position, (backend, status) in enumerate(zip(self.backends, columns.status)):
+            # Backends admitted by the column screen are compatible outright.
+            # Rejected candidates already passed the status, model and compliance
+            # checks, so only the limit checks run to find their reason; the rest
+            # report the first check they fail, in the same order apply_filters
+            # would run them
+            if status == down_code:
+                failure = (FilterCategory.STATUS, BackendFilter.filter_by_status(backend, request))
+            elif position in admitted:
+                failure = None
+            elif position in candidates:
+                failure = BackendFilter.check_limits(backend, request, latencies[backend.backend_id])
+            elif position not in model_positions:
+                failure = (FilterCategory.MODEL_UNSUPPORTED, BackendFilter.filter_by_model(backend, request))
+            else:
+                reason = BackendFilter.filter_by_token_size(backend, request)
+                if reason:
+                    failure = (FilterCategory.TOKEN_LIMIT, reason)
+                else:
+                    failure = (FilterCategory.COMPLIANCE, BackendFilter.filter_by_compliance(backend, request))
             
-            if reason:
-                filtered_out.append({"backend": backend, "reason": reason})
+            if failure:
+                category, reason = failure
+                filtered_out.append({"backend": backend, "reason": reason, "category": category})
             else:
                 compatible_backends.append(backend)
         
         return compatible_backends, filtered_out
     
     def _score_backends(self, request: InferenceRequest, backends: List[Backend], 
-                      user_region: str) -> List[Tuple[Backend, float, int, float]]:
+                      user_region: str,
+                      latencies: Optional[Dict[str, int]] = None,
+                      k: Optional[int] = None
+                      ) -> List[Tuple[Backend, float, int, float]]:
         """
         Score each backend based on a weighted combination of factors.
         Return a list of (backend, score, total_latency, total_cost) tuples sorted by score (lower is better).
+        
+        Args:
+            request: The inference request
+            backends: Backends to score
+            user_region: Region of the user
+            latencies: Optional precomputed backend_id -> network latency map
+            k: If given, only the k best entries are selected and returned; the
+                partial ranking is not stored as the last scoring result
         """
-        scored_backends = []
+        if latencies is None:
+            latencies = self._latency_for_request(user_region, backends)
         
-        for backend in backends:
-            # Calculate network latency between user and this backend
-            network_latency = self.network_latency.get_latency(user_region, backend.region)
-            
-            # Score the backend
-            score, total_latency, total_cost = BackendScorer.score_backend(
-                backend, request, network_latency
-            )
-            
-            scored_backends.append((backend, score, total_latency, total_cost))
+        network_latencies = [latencies[backend.backend_id] for backend in backends]
+        scored_backends = BackendScorer.score_backends(request, backends, network_latencies)
+        
+        if k is not None:
+            # Partial selection with the same ordering (and tie-breaking) as sorted()
+            return heapq.nsmallest(k, scored_backends, key=lambda x: x[1])
         
         # Sort by score (lower is better)
         result = sorted(scored_backends, key=lambda x: x[1])
@@ -962,17 +1517,25 @@ class TesseractRouter:
         # Use provided user region or default
         region = user_region if user_region else self.user_region
         
-        # Get all backends that were considered except the failed one
-        remaining_backends = [b for b in routing_result.considered_backends 
-                             if b.backend_id != failed_backend.backend_id]
+        # Get all backends that were considered except the failed one. The
+        # considered list is ordered by score, so the failed backend is
+        # normally at its head and a slice avoids a per-element comparison
+        considered = routing_result.considered_backends
+        if considered and considered[0].backend_id == failed_backend.backend_id:
+            remaining_backends = considered[1:]
+        else:
+            remaining_backends = [b for b in considered
+                                  if b.backend_id != failed_backend.backend_id]
+        
+        # Add the failed backend to filtered_out list; the original result
+        # keeps its own list untouched
+        filtered_out = [*routing_result.filtered_out,
+                        {"backend": failed_backend, "reason": failure_reason,
+                         "category": FilterCategory.BACKEND_FAILURE}]
         
         if not remaining_backends:
             logger.error(f"No fallback backends available for request {routing_result.request.unique_id}")
             
-            # Add the failed backend to filtered_out list
-            filtered_out = routing_result.filtered_out.copy()
-            filtered_out.append({"backend": failed_backend, "reason": failure_reason})
-            
             return RoutingResult(
                 request=routing_result.request,
                 selected_backend=None,
@@ -985,8 +1548,25 @@ class TesseractRouter:
                 sla_met=False
             )
         
-        # Score the remaining backends
-        scored_backends = self._score_backends(routing_result.request, remaining_backends, region)
+        # Reuse the scores from the original decision when they are still valid:
+        # same considered list, same region and no backend changes since. The
+        # remaining backends keep their order, so dropping the failed entry is enough
+        last_decision = self._last_decision
+        if (last_decision is not None
+                and last_decision[0] is considered
+                and last_decision[1] == region
+                and last_decision[2] == self._backend_version):
+            previous_scores = last_decision[3]
+            if previous_scores[0][0].backend_id == failed_backend.backend_id:
+                scored_backends = previous_scores[1:]
+            else:
+                scored_backends = [entry for entry in previous_scores
+                                   if entry[0].backend_id != failed_backend.backend_id]
+            self._last_scoring_result = scored_backends
+        else:
+            scored_backends = self._score_backends(routing_result.request, remaining_backends, region)
+        
+        self._last_decision = (remaining_backends, region, self._backend_version, scored_backends)
         
         # Select the next best backend
         next_best_backend, next_best_score, total_latency, total_cost = scored_backends[0]
@@ -998,10 +1578,6 @@ class TesseractRouter:
                     f"{next_best_backend.chip_type} in {next_best_backend.region}, "
                     f"latency {total_latency}ms")
         
-        # Add the failed backend to filtered_out list
-        filtered_out = routing_result.filtered_out.copy()
-        filtered_out.append({"backend": failed_backend, "reason": failure_reason})
-        
         return RoutingResult(
             request=routing_result.request,
             selected_backend=next_best_backend,
@@ -1016,12 +1592,33 @@ class TesseractRouter:
             sla_met=sla_met
         )
 
+
+def _route_batch_chunk(router: TesseractRouter, requests: List[InferenceRequest],
+                       region: str) -> Tuple[List[Backend], List[RoutingResult]]:
+    """
+    Worker entry point for route_batch_parallel.
+    
+    The router's backend list is returned alongside the results so that the
+    caller can match the unpickled Backend copies to its own objects.
+    """
+    return router.backends, router.route_batch(requests, region)
+
+
+# Helper function to parse a JSON file, using orjson when it is installed
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, preferring orjson over the standard library parser."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 # Helper function to load a request from a JSON file
 def load_request(request_file: str) -> InferenceRequest:
     """Load an inference request from a JSON file."""
     try:
-        with open(request_file, 'r') as f:
-            request_data = json.load(f)
+        request_data = _read_json(request_file)
         
         return InferenceRequest.from_dict(request_data)
     except Exception as e:
@@ -1033,8 +1630,7 @@ def load_request(request_file: str) -> InferenceRequest:
 def load_all_requests(requests_file: str = "models/inference_request.json") -> List[InferenceRequest]:
     """Load all inference requests from a JSON file."""
     try:
-        with open(requests_file, 'r') as f:
-            requests_data = json.load(f)
+        requests_data = _read_json(requests_file)
         
         return [InferenceRequest.from_dict(req) for req in requests_data]
     except Exception as e:
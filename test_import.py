@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """
-Test script to check which imports work with the current router.py implementation.
+Test script to check which imports work with the current tesseract_router.py implementation.
 This helps diagnose import issues without running the full application.
 """
 
-print("Attempting to import from router.py...")
+print("Attempting to import from tesseract_router.py...")
 
 try:
     print("Trying to import TesseractRouter...")
@@ -41,32 +41,32 @@ try:
 except ImportError as e:
     print(f"❌ Failed to import load_all_requests: {e}")
 
-print("\nChecking router.py content for BackendStatus definition...")
-import os
+print("\nChecking tesseract_router module for BackendStatus definition...")
+import inspect
+import re
 
-if os.path.exists("router.py"):
-    with open("router.py", "r") as f:
-        content = f.read()
-    
-    if "class BackendStatus" in content:
-        print("✅ Found BackendStatus class definition in router.py")
+try:
+    import tesseract_router
+except ImportError as e:
+    print(f"❌ tesseract_router module could not be imported: {e}")
+else:
+    if inspect.isclass(getattr(tesseract_router, "BackendStatus", None)):
+        print("✅ Found BackendStatus class definition in tesseract_router")
     else:
-        print("❌ BackendStatus class definition not found in router.py")
+        print("❌ BackendStatus class definition not found in tesseract_router")
         
-        if "BackendStatus" in content:
-            print("   However, 'BackendStatus' is mentioned in the file")
+        # Search the already-loaded module source once for related definitions
+        source = inspect.getsource(tesseract_router)
+        if "BackendStatus" in source:
+            print("   However, 'BackendStatus' is mentioned in the module")
         
         # Look for status field definition in Backend class
-        if "status:" in content:
-            start_idx = content.find("status:")
-            line_end = content.find("\n", start_idx)
-            status_line = content[start_idx:line_end].strip()
-            print(f"   Found status field definition: {status_line}")
-else:
-    print("❌ router.py file not found!")
+        status_match = re.search(r"^\s*status\s*:.*$", source, re.MULTILINE)
+        if status_match:
+            print(f"   Found status field definition: {status_match.group(0).strip()}")
 
 print("\nRecommendation:")
 print("If BackendStatus is missing, you can:")
 print("1. Run the simplified_main.py script which includes fallbacks")
-print("2. Update your router.py to include the BackendStatus enum")
+print("2. Update your tesseract_router.py to include the BackendStatus enum")
 print("3. Add 'from enum import Enum' and create the BackendStatus enum in your main.py")
\ No newline at end of file
@@ -11,8 +11,10 @@ Usage:
 
 import unittest
 import json
+import os
 import tempfile
 from typing import Dict, List, Set
+from unittest import mock
 
 # Import the modules to test
 from tesseract_router import (
@@ -22,7 +24,9 @@ from tesseract_router import (
     BackendStatus, 
     BackendFilter, 
     BackendScorer, 
-    TesseractRouter
+    NetworkLatencyMap,
+    TesseractRouter,
+    load_all_requests
 )
 
 
@@ -93,6 +97,8 @@ class TestBackend(unittest.TestCase):
         self.assertEqual(backend.status, BackendStatus.HEALTHY)
         self.assertEqual(backend.compliance_tags, {"gdpr", "hipaa"})
         self.assertEqual(backend.max_token_size, 1000)
+        self.assertIsInstance(backend.compliance_tags, frozenset)
+        self.assertEqual(backend.supported_model_set, frozenset(["model1", "model2"]))
     
     def test_status_conversion(self):
         """Test conversion of status strings to BackendStatus enum."""
@@ -305,8 +311,8 @@ class TestBackendScorer(unittest.TestCase):
     
     def test_calculate_base_score(self):
         """Test calculation of base score."""
-        # Base score = latency_ms * cost_per_token
-        expected_score = 100 * 0.001
+        # Base score = latency_ms / max_token_size * input_token_size * cost_per_token
+        expected_score = 100 / 2000 * 1000 * 0.001
         self.assertEqual(BackendScorer.calculate_base_score(self.backend, self.request), expected_score)
     
     def test_apply_health_adjustment(self):
@@ -366,8 +372,8 @@ class TestBackendScorer(unittest.TestCase):
     
     def test_score_backend(self):
         """Test the overall scoring logic."""
-        # For a healthy backend and priority 1 request, the score should be latency_ms * cost_per_token
-        expected_score = 100 * 0.001
+        # For a healthy backend and priority 1 request, the score should be the base score
+        expected_score = 100 / 2000 * 1000 * 0.001
         self.assertEqual(BackendScorer.score_backend(self.backend, self.request), expected_score)
         
         # For a degraded backend, the score should have a 50% penalty
@@ -396,21 +402,79 @@ class TestBackendScorer(unittest.TestCase):
             priority=2
         )
         self.assertEqual(
-            BackendScorer.score_backend(self.backend, lower_priority_request), 
+            BackendScorer.score_backend(self.backend, lower_priority_request),
             expected_score * 0.5
         )
 
+    def test_score_backends_matches_score_backend(self):
+        """Test that batch scoring produces the same values as per-backend scoring."""
+        busy_backend = Backend(
+            backend_id="busy-backend",
+            chip_type="test-chip",
+            latency_ms=120,
+            cost_per_token=0.002,
+            region="test-region",
+            supported_models=["test-model"],
+            status=BackendStatus.DEGRADED,
+            compliance_tags={"gdpr"},
+            max_token_size=2000,
+            current_load=75.0,
+            estimated_queue_time_ms=150
+        )
+        cost_request = InferenceRequest(
+            model_name="test-model",
+            input_token_size=1000,
+            required_latency_ms=200,
+            compliance_constraints={"gdpr"},
+            priority=3,
+            prefer_cost_over_latency=True
+        )
+        backends = [self.backend, busy_backend]
+        network_latencies = [5, 40]
 
-class TestTesseractRouter(unittest.TestCase):
-    """Test the TesseractRouter class."""
+        for request in (self.request, cost_request):
+            scored = BackendScorer.score_backends(request, backends, network_latencies)
+            for (backend, score, latency, cost), net in zip(scored, network_latencies):
+                self.assertEqual((score, latency, cost),
+                                 BackendScorer.score_backend(backend, request, net))
+
+
+class TestNetworkLatencyMap(unittest.TestCase):
+    """Test the NetworkLatencyMap class."""
     
     def setUp(self):
         """Set up test fixtures."""
-        # Create a temporary backends file
-        self.temp_backends_file = tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False)
+        self.latency_map = NetworkLatencyMap()
+    
+    def test_update_latency_invalidates_cache(self):
+        """Test that update_latency replaces a previously cached lookup."""
+        self.assertEqual(self.latency_map.get_latency("us-east-1", "eu-west-1"), 80)
         
+        self.latency_map.update_latency("us-east-1", "eu-west-1", 42)
+        
+        self.assertEqual(self.latency_map.get_latency("us-east-1", "eu-west-1"), 42)
+    
+    def test_lookup_cache_is_bounded(self):
+        """Test that lookups for many unknown regions do not grow the cache without limit."""
+        # Unknown regions log a warning; capture them to keep the test output clean
+        with self.assertLogs("TesseractRouter", level="WARNING"):
+            for i in range(NetworkLatencyMap.LATENCY_CACHE_SIZE * 2):
+                self.assertEqual(self.latency_map.get_latency(f"client-region-{i}", "us-east-1"), 150)
+        
+        self.assertLessEqual(
+            self.latency_map._cached_latency.cache_info().currsize,
+            NetworkLatencyMap.LATENCY_CACHE_SIZE
+        )
+
+
+class TestTesseractRouter(unittest.TestCase):
+    """Test the TesseractRouter class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests in the class."""
         # Define some test backends
-        self.test_backends = [
+        cls.test_backends = [
             {
                 "backend_id": "backend1",
                 "chip_type": "GPU",
@@ -446,13 +510,12 @@ class TestTesseractRouter(unittest.TestCase):
             }
         ]
         
-        # Write backends to the temporary file
-        json.dump(self.test_backends, self.temp_backends_file)
-        self.temp_backends_file.flush()
-        
-        # Create a router with the temporary backends file
-        self.router = TesseractRouter(self.temp_backends_file.name)
-        
+        # Create a router from the in-memory definitions, shared by tests that
+        # do not change backend state
+        cls.router = TesseractRouter.from_backend_dicts(cls.test_backends)
+    
+    def setUp(self):
+        """Set up per-test fixtures."""
         # Define a test request
         self.request = InferenceRequest(
             model_name="model1",
@@ -461,17 +524,50 @@ class TestTesseractRouter(unittest.TestCase):
             compliance_constraints={"gdpr"}
         )
     
-    def tearDown(self):
-        """Clean up after tests."""
-        import os
-        os.unlink(self.temp_backends_file.name)
+    def _write_temp_json(self, data) -> str:
+        """Write data to a temporary JSON file that is removed after the test."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
     
     def test_load_backends(self):
         """Test loading backends from a file."""
-        self.assertEqual(len(self.router.backends), 3)
-        self.assertEqual(self.router.backends[0].backend_id, "backend1")
-        self.assertEqual(self.router.backends[1].backend_id, "backend2")
-        self.assertEqual(self.router.backends[2].backend_id, "backend3")
+        router = TesseractRouter(self._write_temp_json(self.test_backends))
+        
+        self.assertEqual(len(router.backends), 3)
+        self.assertEqual(router.backends[0].backend_id, "backend1")
+        self.assertEqual(router.backends[1].backend_id, "backend2")
+        self.assertEqual(router.backends[2].backend_id, "backend3")
+        # The file path builds the same backends as the in-memory constructor
+        self.assertEqual(router.backends, self.router.backends)
+    
+    def test_load_all_requests_with_and_without_orjson(self):
+        """Test that request files parse the same with orjson and with the json module."""
+        requests_file = self._write_temp_json([
+            {
+                "model_name": "model1",
+                "input_token_size": 500,
+                "required_latency_ms": 150,
+                "compliance_constraints": ["gdpr"],
+                "unique_id": "req_a"
+            },
+            {
+                "model_name": "model2",
+                "input_token_size": 3000,
+                "required_latency_ms": 1000,
+                "compliance_constraints": ["sox"],
+                "unique_id": "req_b",
+                "priority": 2
+            }
+        ])
+        
+        parsed = load_all_requests(requests_file)
+        with mock.patch("tesseract_router.orjson", None):
+            parsed_stdlib = load_all_requests(requests_file)
+        
+        self.assertEqual([r.unique_id for r in parsed], ["req_a", "req_b"])
+        self.assertEqual(parsed, parsed_stdlib)
     
     def test_filter_compatible_backends(self):
         """Test filtering compatible backends."""
@@ -492,8 +588,8 @@ class TestTesseractRouter(unittest.TestCase):
         scored = self.router._score_backends(self.request, compatible)
         
         # Verify that backends are scored correctly
-        # backend1: 100 * 0.001 = 0.1
-        # backend2: 80 * 0.002 = 0.16
+        # backend1: 100 / 2000 * 500 * 0.001 = 0.025
+        # backend2: 80 / 1000 * 500 * 0.002 = 0.08
         # backend1 should have a better (lower) score
         self.assertEqual(len(scored), 2)
         self.assertEqual(scored[0][0].backend_id, "backend1")
@@ -530,20 +626,212 @@ class TestTesseractRouter(unittest.TestCase):
         self.assertEqual(fallback_result.original_backend, result.selected_backend)
         self.assertEqual(fallback_result.fallback_reason, "Test failure")
     
+    def test_route_requests(self):
+        """Test routing a batch of requests preserves order and per-request results."""
+        requests = [
+            self.request,
+            InferenceRequest(
+                model_name="model2",
+                input_token_size=500,
+                required_latency_ms=400,
+                compliance_constraints={"hipaa"}
+            ),
+            InferenceRequest(
+                model_name="unknown-model",
+                input_token_size=500,
+                required_latency_ms=400,
+                compliance_constraints=set()
+            )
+        ]
+
+        results = self.router.route_requests(requests, "us-east-1", max_workers=2)
+
+        self.assertEqual(len(results), len(requests))
+        for request, result in zip(requests, results):
+            expected = self.router.route_request(request, "us-east-1")
+            self.assertIs(result.request, request)
+            self.assertEqual(result.selected_backend, expected.selected_backend)
+            self.assertEqual(result.final_latency_ms, expected.final_latency_ms)
+        self.assertIsNone(results[2].selected_backend)
+
+    def test_route_batch(self):
+        """Test that batch routing matches routing each request individually."""
+        requests = [
+            self.request,
+            InferenceRequest(
+                model_name="model2",
+                input_token_size=3000,
+                required_latency_ms=1000,
+                compliance_constraints={"sox"}
+            ),
+            InferenceRequest(
+                model_name="unknown-model",
+                input_token_size=500,
+                required_latency_ms=400,
+                compliance_constraints=set()
+            ),
+            # Same model and compliance bucket as self.request, different limits
+            InferenceRequest(
+                model_name="model1",
+                input_token_size=1500,
+                required_latency_ms=1000,
+                compliance_constraints={"gdpr"}
+            )
+        ]
+
+        results = self.router.route_batch(requests, "us-east-1")
+
+        self.assertEqual(len(results), len(requests))
+        for request, result in zip(requests, results):
+            expected = self.router.route_request(request, "us-east-1")
+            self.assertIs(result.request, request)
+            self.assertEqual(result.selected_backend, expected.selected_backend)
+            self.assertEqual(result.considered_backends, expected.considered_backends)
+            self.assertEqual(
+                [entry["reason"] for entry in result.filtered_out],
+                [entry["reason"] for entry in expected.filtered_out]
+            )
+        self.assertEqual(results[1].selected_backend.backend_id, "backend3")
+    
+    def test_route_batch_parallel(self):
+        """Test that parallel batch routing matches serial routing."""
+        other = InferenceRequest(
+            model_name="model2",
+            input_token_size=3000,
+            required_latency_ms=1000,
+            compliance_constraints={"sox"}
+        )
+        requests = [self.request, other] * (TesseractRouter.PARALLEL_BATCH_THRESHOLD // 2)
+
+        results = self.router.route_batch_parallel(requests, "us-east-1", max_workers=2)
+        expected = self.router.route_batch(requests, "us-east-1")
+
+        self.assertEqual(len(results), len(requests))
+        for request, result, serial in zip(requests, results, expected):
+            self.assertIs(result.request, request)
+            # Results refer to the router's own backends, not worker copies
+            self.assertIs(result.selected_backend, serial.selected_backend)
+            self.assertEqual(
+                [id(backend) for backend in result.considered_backends],
+                [id(backend) for backend in serial.considered_backends]
+            )
+        self.assertIsNone(results[2].selected_backend)
+
+    def test_recommendations_keep_compliance_order(self):
+        """Test that the request profile echoes the caller's compliance constraints."""
+        recommendations = self.router.get_routing_recommendations(
+            "model1", 1000, ["hipaa", "gdpr"], "us-east"
+        )
+        
+        self.assertEqual(recommendations["request_profile"]["compliance_constraints"], ["hipaa", "gdpr"])
+    
+    def test_recommendations_invalidated_by_updates(self):
+        """Test that backend and latency updates invalidate memoized recommendations."""
+        # This test changes backend state, so it uses its own router
+        router = TesseractRouter.from_backend_dicts(self.test_backends)
+        
+        def recommended():
+            recommendations = router.get_routing_recommendations("model1", 1000, ["gdpr"], "us-east")
+            return recommendations["recommended_backend"]["backend_id"]
+        
+        # Repeated calls for the same profile are served from the memo
+        first = router.get_routing_recommendations("model1", 1000, ["gdpr"], "us-east")
+        self.assertIs(router.get_routing_recommendations("model1", 1000, ["gdpr"], "us-east"), first)
+        self.assertEqual(recommended(), "backend3")
+        
+        router.update_backend_status("backend3", "down")
+        self.assertEqual(recommended(), "backend1")
+        router.update_backend_status("backend3", "degraded")
+        self.assertEqual(recommended(), "backend3")
+        
+        # A long queue makes backend3 score worse than backend1
+        router.update_backend_load("backend3", 100.0, 500)
+        self.assertEqual(recommended(), "backend1")
+        router.update_backend_load("backend3", 0.0, 0)
+        self.assertEqual(recommended(), "backend3")
+        
+        # Pushing backend3's network latency past the SLA filters it out
+        router.update_network_latency("us-east", "eu-west", 5000)
+        self.assertEqual(recommended(), "backend1")
+    
+    def test_stats_cache_invalidated_by_backend_changes(self):
+        """Test that cached stats are reused until a backend change bumps the version."""
+        # This test changes backend state, so it uses its own router
+        router = TesseractRouter.from_backend_dicts(self.test_backends)
+        
+        stats = router.get_global_routing_stats()
+        region_stats = router.get_region_stats()
+        self.assertIs(router.get_global_routing_stats(), stats)
+        self.assertIs(router.get_region_stats(), region_stats)
+        self.assertEqual(stats["down_backends"], 0)
+        
+        version = router._backend_version
+        router.update_backend_status("backend1", "down")
+        self.assertGreater(router._backend_version, version)
+        
+        updated = router.get_global_routing_stats()
+        self.assertIsNot(updated, stats)
+        self.assertEqual(updated["down_backends"], 1)
+        self.assertIsNot(router.get_region_stats(), region_stats)
+    
+    def test_handle_backend_failure_reuses_scores(self):
+        """Test that a fallback reuses the original scores while backends are unchanged."""
+        router = TesseractRouter.from_backend_dicts(self.test_backends)
+        request = InferenceRequest(
+            model_name="model1",
+            input_token_size=500,
+            required_latency_ms=1000,
+            compliance_constraints={"gdpr"}
+        )
+        result = router.route_request(request, "us-east")
+        self.assertEqual(len(result.considered_backends), 3)
+        
+        with mock.patch.object(router, "_score_backends", wraps=router._score_backends) as score:
+            fallback = router.handle_backend_failure(result, "test failure", "us-east")
+        
+        score.assert_not_called()
+        self.assertEqual(fallback.selected_backend, result.considered_backends[1])
+        self.assertEqual(fallback.considered_backends, result.considered_backends[1:])
+    
+    def test_handle_backend_failure_rescores_after_backend_change(self):
+        """Test that a fallback rescores when a backend changed after the original decision."""
+        # This test changes backend state, so it uses its own router
+        router = TesseractRouter.from_backend_dicts(self.test_backends)
+        request = InferenceRequest(
+            model_name="model1",
+            input_token_size=500,
+            required_latency_ms=1000,
+            compliance_constraints={"gdpr"}
+        )
+        result = router.route_request(request, "us-east")
+        runner_up = result.considered_backends[1]
+        last = result.considered_backends[2]
+        
+        # A long queue on the runner-up drops it behind the last backend
+        router.update_backend_load(runner_up.backend_id, 100.0, 800)
+        with mock.patch.object(router, "_score_backends", wraps=router._score_backends) as score:
+            fallback = router.handle_backend_failure(result, "test failure", "us-east")
+        
+        score.assert_called_once()
+        self.assertEqual(fallback.selected_backend, last)
+    
     def test_update_backend_status(self):
         """Test updating backend status."""
+        # This test changes backend state, so it uses its own router
+        router = TesseractRouter.from_backend_dicts(self.test_backends)
+        
         # Verify initial status
-        self.assertEqual(self.router.backends[0].status, BackendStatus.HEALTHY)
+        self.assertEqual(router.backends[0].status, BackendStatus.HEALTHY)
         
         # Update status to degraded
-        success = self.router.update_backend_status("backend1", "degraded")
+        success = router.update_backend_status("backend1", "degraded")
         
         # Verify the update was successful
         self.assertTrue(success)
-        self.assertEqual(self.router.backends[0].status, BackendStatus.DEGRADED)
+        self.assertEqual(router.backends[0].status, BackendStatus.DEGRADED)
         
         # Try to update a non-existent backend
-        success = self.router.update_backend_status("nonexistent", "healthy")
+        success = router.update_backend_status("nonexistent", "healthy")
         
         # Verify the update failed
         self.assertFalse(success)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Tesseract utility helpers.
+
+This module contains unit tests for the JSON loading in ConfigManager.
+
+Usage:
+    python -m unittest tests/test_utils.py
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import utils
+from utils import ConfigManager
+
+
+class TestConfigManagerLoadJson(unittest.TestCase):
+    """Test ConfigManager.load_json_file and its parse cache."""
+
+    def setUp(self):
+        """Set up a temporary JSON file and an empty parse cache."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+            f.write(b'{"backends": ["a", "b"], "limit": 10}')
+        self.path = f.name
+        self.addCleanup(os.unlink, self.path)
+
+        cache_patch = mock.patch.dict(utils._JSON_CACHE, clear=True)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def test_cache_hit(self):
+        """Test that an unchanged file is parsed only once."""
+        with mock.patch("utils._parse_json", wraps=utils._parse_json) as parse:
+            first = ConfigManager.load_json_file(self.path)
+            second = ConfigManager.load_json_file(self.path)
+
+        self.assertEqual(first, {"backends": ["a", "b"], "limit": 10})
+        self.assertIs(second, first)
+        parse.assert_called_once()
+
+    def test_same_size_rewrite_invalidates(self):
+        """Test that a rewrite is picked up even when size and mtime are unchanged."""
+        first = ConfigManager.load_json_file(self.path)
+        stat = os.stat(self.path)
+
+        with open(self.path, 'wb') as f:
+            f.write(b'{"backends": ["c", "d"], "limit": 20}')
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.stat(self.path).st_size, stat.st_size)
+
+        second = ConfigManager.load_json_file(self.path)
+
+        self.assertEqual(first, {"backends": ["a", "b"], "limit": 10})
+        self.assertEqual(second, {"backends": ["c", "d"], "limit": 20})
+
+    def test_orjson_and_json_parity(self):
+        """Test that the orjson and json module parsers produce the same data."""
+        with open(self.path, 'wb') as f:
+            f.write('{"name": "caf\\u00e9", "ratio": 0.5, "tags": [], "none": null}'.encode())
+
+        parsed = ConfigManager.load_json_file(self.path)
+        utils._JSON_CACHE.clear()
+        with mock.patch("utils.orjson", None):
+            parsed_stdlib = ConfigManager.load_json_file(self.path)
+
+        self.assertEqual(parsed, {"name": "café", "ratio": 0.5, "tags": [], "none": None})
+        self.assertEqual(parsed_stdlib, parsed)
+
+    def test_invalid_json_raises(self):
+        """Test that invalid JSON raises JSONDecodeError with either parser."""
+        with open(self.path, 'wb') as f:
+            f.write(b'{"backends": ')
+
+        with self.assertLogs("TesseractUtils", level="ERROR"):
+            with self.assertRaises(utils.json.JSONDecodeError):
+                ConfigManager.load_json_file(self.path)
+            with mock.patch("utils.orjson", None):
+                with self.assertRaises(utils.json.JSONDecodeError):
+                    ConfigManager.load_json_file(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
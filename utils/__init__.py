@@ -6,12 +6,32 @@ This package contains utility modules for the Tesseract AI Inference Router.
 
 import logging
 import json
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+import os
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson  # Optional: faster C JSON parser
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger("TesseractUtils")
 
+# Built once rather than on every validate_non_negative_float call
+_NUMBER_TYPES = (int, float)
+
+# Parsed JSON files keyed by absolute path, stored with the raw bytes they
+# were parsed from so that any edit on disk is picked up
+_JSON_CACHE: Dict[str, Tuple[bytes, Any]] = {}
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson over the standard library parser."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class ConfigManager:
     """Manages configuration files for the Tesseract router."""
@@ -21,6 +41,11 @@ class ConfigManager:
         """
         Load and parse a JSON file.
         
+        Parsed content is cached per file and reused while the file's bytes
+        are unchanged, which skips the parse but not the read. The returned
+        object is shared between callers and must be treated as read-only;
+        copy it before making changes.
+        
         Args:
             file_path: Path to the JSON file
             
@@ -32,8 +57,17 @@ class ConfigManager:
             json.JSONDecodeError: If the file isn't valid JSON
         """
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            path = os.path.abspath(file_path)
+            with open(path, 'rb') as f:
+                raw = f.read()
+            
+            cached = _JSON_CACHE.get(path)
+            if cached is not None and cached[0] == raw:
+                data = cached[1]
+            else:
+                data = _parse_json(raw)
+                _JSON_CACHE[path] = (raw, data)
+            return data
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Error loading JSON from {file_path}: {e}")
             raise
@@ -52,6 +86,7 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
+            _JSON_CACHE.pop(os.path.abspath(file_path), None)
             with open(file_path, 'w') as f:
                 json.dump(data, f, indent=indent)
             return True
@@ -72,13 +107,17 @@ class ConfigManager:
             Merged configuration dictionary
         """
         result = base_config.copy()
+        if not override_config:
+            return result
         
         for key, value in override_config.items():
             # If both values are dictionaries, merge them recursively
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = ConfigManager.merge_configs(result[key], value)
-            else:
-                result[key] = value
+            if isinstance(value, dict):
+                base_value = result.get(key)
+                if isinstance(base_value, dict):
+                    result[key] = ConfigManager.merge_configs(base_value, value)
+                    continue
+            result[key] = value
         
         return result
 
@@ -118,7 +157,7 @@ class Validator:
         Raises:
             ValidationError: If validation fails
         """
-        if not isinstance(value, (int, float)) or value < 0:
+        if not isinstance(value, _NUMBER_TYPES) or value < 0:
             raise ValidationError(f"{name} must be a non-negative number, got {value}")
     
     @staticmethod
@@ -175,10 +214,11 @@ class Validator:
         if not isinstance(value, dict):
             raise ValidationError(f"{name} must be a dictionary, got {type(value).__name__}")
         
-        if required_keys:
+        # One set comparison on the common path; the ordered list of missing
+        # keys is only built when the check fails
+        if required_keys and not value.keys() >= set(required_keys):
             missing_keys = [key for key in required_keys if key not in value]
-            if missing_keys:
-                raise ValidationError(f"{name} is missing required keys: {', '.join(missing_keys)}")
+            raise ValidationError(f"{name} is missing required keys: {', '.join(missing_keys)}")
 
 
 class FileUtils:
@@ -192,7 +232,7 @@ class FileUtils:
         Args:
             directory_path: Path to the directory
         """
-        Path(directory_path).mkdir(parents=True, exist_ok=True)
+        os.makedirs(directory_path, exist_ok=True)
     
     @staticmethod
     def get_files_with_extension(directory_path: str, extension: str) -> List[str]:
@@ -206,4 +246,11 @@ class FileUtils:
         Returns:
             List of file paths
         """
-        return [str(f) for f in Path(directory_path).glob(f"*{extension}")]
\ No newline at end of file
+        # A plain suffix test on scandir entries avoids compiling and
+        # matching a glob pattern for every directory entry
+        try:
+            with os.scandir(directory_path) as entries:
+                return [entry.path for entry in entries
+                        if entry.name.endswith(extension) and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
\ No newline at end of file
@@ -6,51 +6,120 @@ routing decisions. It supports the router's core decision-making process
 and provides helpful visualization functions for terminal output.
 """
 
-from typing import Dict, List, Any, Optional
+import io
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Dict, Iterator, List, Any, Optional
 from dataclasses import asdict
 import json
 
+try:
+    import orjson  # Optional: faster C JSON serializer
+except ImportError:
+    orjson = None
+
+# Buffer size used by buffered_stdout
+STDOUT_BUFFER_SIZE = 128 * 1024
+
+
+@contextmanager
+def buffered_stdout(buffer_size: int = STDOUT_BUFFER_SIZE) -> Iterator[None]:
+    """
+    Route sys.stdout through a large, non-line-buffered writer for a block.
+    
+    Reports printed inside the block reach the terminal in a few large writes
+    on exit instead of being flushed line by line. Streams without a binary
+    buffer (such as io.StringIO) are left as they are.
+    
+    Args:
+        buffer_size: Size of the output buffer in bytes
+    """
+    stdout = sys.stdout
+    binary = getattr(stdout, "buffer", None)
+    if binary is None:
+        yield
+        return
+    
+    stdout.flush()
+    buffered = io.TextIOWrapper(io.BufferedWriter(binary, buffer_size),
+                                encoding=stdout.encoding, errors=stdout.errors,
+                                line_buffering=False, write_through=False)
+    sys.stdout = buffered
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+        buffered.flush()
+        # Detach both wrappers so that neither closes the real stdout buffer
+        buffered.detach().detach()
+        stdout.flush()
+
+
+# ANSI color codes, also exposed as ColorFormatter attributes
+_RESET = "\033[0m"
+_BOLD = "\033[1m"
+_RED = "\033[91m"
+_GREEN = "\033[92m"
+_YELLOW = "\033[93m"
+_BLUE = "\033[94m"
+_MAGENTA = "\033[95m"
+_CYAN = "\033[96m"
+
 
 class ColorFormatter:
     """Provides ANSI color codes for terminal visualization."""
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    RED = "\033[91m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    BLUE = "\033[94m"
-    MAGENTA = "\033[95m"
-    CYAN = "\033[96m"
+    RESET = _RESET
+    BOLD = _BOLD
+    RED = _RED
+    GREEN = _GREEN
+    YELLOW = _YELLOW
+    BLUE = _BLUE
+    MAGENTA = _MAGENTA
+    CYAN = _CYAN
+    
+    # Status lookups, built once; unknown statuses are shown as down
+    _STATUS_TEXT = {
+        "healthy": f"{GREEN}{BOLD}Healthy{RESET}",
+        "degraded": f"{YELLOW}{BOLD}Degraded{RESET}",
+        "down": f"{RED}{BOLD}Down{RESET}",
+    }
+    _STATUS_SYMBOL = {"healthy": "✓", "degraded": "!", "down": "✗"}
+    _STATUS_COLOR = {"healthy": GREEN, "degraded": YELLOW, "down": RED}
     
     @classmethod
     def status_text(cls, status: str) -> str:
         """Get a colored text representation of a status."""
-        if status == "healthy":
-            return f"{cls.GREEN}{cls.BOLD}Healthy{cls.RESET}"
-        elif status == "degraded":
-            return f"{cls.YELLOW}{cls.BOLD}Degraded{cls.RESET}"
-        else:  # down
-            return f"{cls.RED}{cls.BOLD}Down{cls.RESET}"
+        return cls._STATUS_TEXT.get(status, cls._STATUS_TEXT["down"])
     
     @classmethod
     def status_symbol(cls, status: str) -> str:
         """Get an emoji/symbol representation of a status."""
-        if status == "healthy":
-            return "✓"
-        elif status == "degraded":
-            return "!"
-        else:  # down
-            return "✗"
+        return cls._STATUS_SYMBOL.get(status, cls._STATUS_SYMBOL["down"])
     
     @staticmethod
     def status_color(status: str) -> str:
         """Get the appropriate color formatting for a status."""
-        if status == "healthy":
-            return ColorFormatter.GREEN
-        elif status == "degraded":
-            return ColorFormatter.YELLOW
-        else:  # down
-            return ColorFormatter.RED
+        return ColorFormatter._STATUS_COLOR.get(status, _RED)
+
+
+# Fixed report headers and section labels, formatted once at import time
+_HEADER_DECISION = f"\n{_BOLD}{_BLUE}===== TESSERACT ROUTING DECISION ====={_RESET}\n"
+_HEADER_SUMMARY = f"\n{_BOLD}{_BLUE}===== TESSERACT ROUTING SUMMARY ====={_RESET}\n"
+_HEADER_HEATMAP = f"\n{_BOLD}{_CYAN}Cluster Health Heatmap{_RESET}\n"
+_HEADER_ROUTING_PATH = f"\n{_BOLD}{_CYAN}Routing Path:{_RESET}\n"
+_LABEL_REQUEST_INFO = f"{_BOLD}{_MAGENTA}Request Information:{_RESET}"
+_LABEL_DECISION = f"\n{_BOLD}Routing Decision:{_RESET}"
+_LABEL_FALLBACK = f"\n  {_BOLD}{_RED}FALLBACK ROUTE{_RESET}"
+_LABEL_CONSIDERED = f"\n{_BOLD}Considered Backends:{_RESET}"
+_LABEL_FILTERED = f"\n{_BOLD}Filtered Out Backends:{_RESET}"
+_LABEL_ROUTER = f"  {_BOLD}Tesseract Router{_RESET}"
+_LABEL_NO_BACKEND = f"  {_RED}{_BOLD}Error: No Compatible Backend{_RESET}"
+_LABEL_REQUEST_STATS = f"{_BOLD}Request Statistics:{_RESET}"
+_LABEL_PERFORMANCE = f"\n{_BOLD}Performance Metrics:{_RESET}"
+_LABEL_USAGE = f"\n{_BOLD}Backend Usage:{_RESET}"
+_USAGE_ROW = "    %s: %s requests (%.1f%%)"
 
 
 class RoutingVisualizer:
@@ -64,60 +133,66 @@ class RoutingVisualizer:
         Args:
             decision: A dictionary containing the routing decision
         """
-        c = ColorFormatter
+        # Bind the color codes used below to locals
+        BOLD, RESET, RED, GREEN, CYAN = _BOLD, _RESET, _RED, _GREEN, _CYAN
+        status_text = ColorFormatter.status_text
         
-        # Print header
-        print(f"\n{c.BOLD}{c.BLUE}===== TESSERACT ROUTING DECISION ====={c.RESET}\n")
+        # Collect the lines and write them in one call rather than one print per line
+        lines = []
         
-        # Print request info
+        # Header
+        lines.append(_HEADER_DECISION)
+        
+        # Request info
         req_info = decision["request_info"]
-        print(f"{c.BOLD}{c.MAGENTA}Request Information:{c.RESET}")
-        print(f"  Request ID: {req_info['id']}")
-        print(f"  Model: {req_info['model']}")
-        print(f"  Input Tokens: {req_info['input_tokens']}")
-        print(f"  Required Latency: {req_info['required_latency_ms']} ms")
+        lines.append(_LABEL_REQUEST_INFO)
+        lines.append(f"  Request ID: {req_info['id']}")
+        lines.append(f"  Model: {req_info['model']}")
+        lines.append(f"  Input Tokens: {req_info['input_tokens']}")
+        lines.append(f"  Required Latency: {req_info['required_latency_ms']} ms")
         
         compliance_text = ', '.join(req_info['compliance']) if req_info['compliance'] else 'None'
-        print(f"  Compliance: {compliance_text}")
-        print(f"  Priority: {req_info['priority']}")
+        lines.append(f"  Compliance: {compliance_text}")
+        lines.append(f"  Priority: {req_info['priority']}")
         
-        # Print decision
-        print(f"\n{c.BOLD}Routing Decision:{c.RESET}")
+        # Decision
+        lines.append(_LABEL_DECISION)
         if "error" in decision["decision"]:
-            print(f"  {c.RED}{c.BOLD}Error: {decision['decision']['error']}{c.RESET}")
+            lines.append(f"  {RED}{BOLD}Error: {decision['decision']['error']}{RESET}")
         else:
             selected = decision["decision"]
-            print(f"  Selected: {c.BOLD}{c.CYAN}{selected['chip_type']}{c.RESET} in {c.GREEN}{selected['region']}{c.RESET}")
-            print(f"  Backend ID: {selected['selected_backend_id']}")
-            print(f"  Status: {c.status_text(selected['status'])}")
-            print(f"  Score: {selected['score']:.6f}")
-            print(f"  Expected Latency: {c.BOLD}{selected['final_latency_ms']} ms{c.RESET}")
-            print(f"  Total Cost: ${selected['final_cost']:.6f}")
+            lines.append(f"  Selected: {BOLD}{CYAN}{selected['chip_type']}{RESET} in {GREEN}{selected['region']}{RESET}")
+            lines.append(f"  Backend ID: {selected['selected_backend_id']}")
+            lines.append(f"  Status: {status_text(selected['status'])}")
+            lines.append(f"  Score: {selected['score']:.6f}")
+            lines.append(f"  Expected Latency: {BOLD}{selected['final_latency_ms']} ms{RESET}")
+            lines.append(f"  Total Cost: ${selected['final_cost']:.6f}")
             
             if decision["is_fallback"]:
                 fallback = decision["fallback_info"]
-                print(f"\n  {c.BOLD}{c.RED}FALLBACK ROUTE{c.RESET}")
-                print(f"  Original: {c.BOLD}{fallback['original_chip_type']}{c.RESET}")
-                print(f"  Reason: {fallback['failure_reason']}")
+                lines.append(_LABEL_FALLBACK)
+                lines.append(f"  Original: {BOLD}{fallback['original_chip_type']}{RESET}")
+                lines.append(f"  Reason: {fallback['failure_reason']}")
         
-        # Print considered backends
-        print(f"\n{c.BOLD}Considered Backends:{c.RESET}")
+        # Considered backends
+        lines.append(_LABEL_CONSIDERED)
         if not decision["considered_backends"]:
-            print("  None")
+            lines.append("  None")
         else:
             for backend in decision["considered_backends"]:
-                print(f"  {backend['id']} - {backend['chip']} in {backend['region']} - {c.status_text(backend['status'])}")
+                lines.append(f"  {backend['id']} - {backend['chip']} in {backend['region']} - {status_text(backend['status'])}")
         
-        # Print filtered backends
-        print(f"\n{c.BOLD}Filtered Out Backends:{c.RESET}")
+        # Filtered backends
+        lines.append(_LABEL_FILTERED)
         if not decision["filtered_backends"]:
-            print("  None")
+            lines.append("  None")
         else:
             for backend in decision["filtered_backends"]:
-                print(f"  {backend['id']} - {backend['chip']} in {backend['region']}")
-                print(f"    Reason: {backend['reason']}")
+                lines.append(f"  {backend['id']} - {backend['chip']} in {backend['region']}")
+                lines.append(f"    Reason: {backend['reason']}")
         
-        print("\n")
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     @staticmethod
     def create_health_heatmap(backends: List[Dict[str, Any]]) -> None:
@@ -127,14 +202,26 @@ class RoutingVisualizer:
         Args:
             backends: A list of backend dictionaries
         """
-        c = ColorFormatter
-        
-        # Group backends by region and chip type
-        regions = sorted(set(b["region"] for b in backends))
-        chip_types = sorted(set(b["chip_type"] for b in backends))
-        
-        # Print header
-        print(f"\n{c.BOLD}{c.CYAN}Cluster Health Heatmap{c.RESET}\n")
+        # Bind the color codes used below to locals
+        BOLD, RESET = _BOLD, _RESET
+        status_color = ColorFormatter.status_color
+        
+        # Group backends by region and chip type, keeping the first backend
+        # seen for each (region, chip type) cell
+        first_by_cell = {}
+        region_set = set()
+        chip_set = set()
+        for b in backends:
+            region = b["region"]
+            chip = b["chip_type"]
+            region_set.add(region)
+            chip_set.add(chip)
+            first_by_cell.setdefault((region, chip), b)
+        regions = sorted(region_set)
+        chip_types = sorted(chip_set)
+        
+        # Header; rows are assembled as whole strings and written in one call
+        lines = [_HEADER_HEATMAP]
         
         # Calculate column widths
         region_width = max(len(region) for region in regions) + 2
@@ -142,36 +229,42 @@ class RoutingVisualizer:
         for chip in chip_types:
             chip_widths[chip] = max(len(chip) + 2, 10)
         
-        # Print header row
-        print(" " * region_width, end="")
+        # Header row
+        row = [" " * region_width]
         for chip in chip_types:
-            print(f"{c.BOLD}{chip.center(chip_widths[chip])}{c.RESET}", end="")
-        print()
+            row.append(f"{BOLD}{chip.center(chip_widths[chip])}{RESET}")
+        lines.append("".join(row))
+        
+        # Separator
+        lines.append("-" * (region_width + sum(chip_widths.values())))
         
-        # Print separator
-        print("-" * (region_width + sum(chip_widths.values())))
+        # Padded cell strings, formatted once per (status, width)
+        cell_cache = {}
+        empty_cells = {chip: "-".center(width) for chip, width in chip_widths.items()}
         
-        # Print rows
+        # Rows
         for region in regions:
-            print(f"{c.BOLD}{region.ljust(region_width)}{c.RESET}", end="")
+            row = [f"{BOLD}{region.ljust(region_width)}{RESET}"]
             
             for chip in chip_types:
-                # Find matching backends
-                matching = [b for b in backends if b["region"] == region and b["chip_type"] == chip]
+                # Use the status of the first matching backend
+                backend = first_by_cell.get((region, chip))
                 
-                if matching:
-                    # Use the status of the first matching backend
-                    backend = matching[0]
+                if backend is not None:
                     status = backend["status"]
-                    
-                    status_text = f"{c.status_color(status)}■ {status.capitalize()}{c.RESET}"
-                    print(status_text.center(chip_widths[chip]), end="")
+                    width = chip_widths[chip]
+                    cell = cell_cache.get((status, width))
+                    if cell is None:
+                        status_text = f"{status_color(status)}■ {status.capitalize()}{RESET}"
+                        cell = cell_cache[(status, width)] = status_text.center(width)
+                    row.append(cell)
                 else:
-                    print("-".center(chip_widths[chip]), end="")
+                    row.append(empty_cells[chip])
             
-            print()
+            lines.append("".join(row))
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     @staticmethod
     def visualize_routing_path(result: Dict[str, Any]) -> None:
@@ -181,24 +274,25 @@ class RoutingVisualizer:
         Args:
             result: The routing result dictionary
         """
-        c = ColorFormatter
+        # Bind the color codes used below to locals
+        BOLD, RESET, RED, GREEN, YELLOW = _BOLD, _RESET, _RED, _GREEN, _YELLOW
         request = result["request_info"]
         
-        print(f"\n{c.BOLD}{c.CYAN}Routing Path:{c.RESET}\n")
+        lines = [_HEADER_ROUTING_PATH]
         
         # Step 1: Request
-        print(f"  {c.BOLD}Request{c.RESET}: {request['model']} ({request['input_tokens']} tokens)")
-        print("     │")
-        print("     ▼")
+        lines.append(f"  {BOLD}Request{RESET}: {request['model']} ({request['input_tokens']} tokens)")
+        lines.append("     │")
+        lines.append("     ▼")
         
         # Step 2: Router
-        print(f"  {c.BOLD}Tesseract Router{c.RESET}")
-        print("     │")
-        print("     ▼")
+        lines.append(_LABEL_ROUTER)
+        lines.append("     │")
+        lines.append("     ▼")
         
         # Step 3: Backend Selection
         if "error" in result["decision"]:
-            print(f"  {c.RED}{c.BOLD}Error: No Compatible Backend{c.RESET}")
+            lines.append(_LABEL_NO_BACKEND)
         else:
             selected = result["decision"]
             
@@ -206,17 +300,18 @@ class RoutingVisualizer:
                 fallback = result["fallback_info"]
                 
                 # Original backend that failed
-                print(f"  {c.BOLD}Primary Backend{c.RESET}: {fallback['original_chip_type']}")
-                print(f"  {c.RED}Failed: {fallback['failure_reason']}{c.RESET}")
-                print("     │")
-                print("     ▼")
+                lines.append(f"  {BOLD}Primary Backend{RESET}: {fallback['original_chip_type']}")
+                lines.append(f"  {RED}Failed: {fallback['failure_reason']}{RESET}")
+                lines.append("     │")
+                lines.append("     ▼")
                 
                 # Fallback backend
-                print(f"  {c.YELLOW}{c.BOLD}Fallback Backend{c.RESET}: {selected['chip_type']} in {selected['region']}")
+                lines.append(f"  {YELLOW}{BOLD}Fallback Backend{RESET}: {selected['chip_type']} in {selected['region']}")
             else:
-                print(f"  {c.GREEN}{c.BOLD}Selected Backend{c.RESET}: {selected['chip_type']} in {selected['region']}")
+                lines.append(f"  {GREEN}{BOLD}Selected Backend{RESET}: {selected['chip_type']} in {selected['region']}")
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class RoutingReport:
@@ -237,27 +332,34 @@ class RoutingReport:
             A dictionary with summary statistics
         """
         total_count = len(routing_results)
-        successful_routes = sum(1 for result in routing_results if result["selected_backend"] is not None)
-        fallback_routes = sum(1 for result in routing_results if result.get("is_fallback", False))
+        successful_routes = 0
+        fallback_routes = 0
         
-        # Calculate average metrics for successful routes
+        # Accumulate all counters and totals in a single pass
         total_latency = 0
         total_cost = 0
-        backend_usage = {}
+        backend_usage = Counter()
         
         for result in routing_results:
-            if "decision" in result and "error" not in result["decision"]:
-                total_latency += result["decision"]["final_latency_ms"]
-                total_cost += result["decision"]["final_cost"]
+            if result["selected_backend"] is not None:
+                successful_routes += 1
+            if result.get("is_fallback"):
+                fallback_routes += 1
+            
+            decision = result.get("decision")
+            if decision is not None and "error" not in decision:
+                total_latency += decision["final_latency_ms"]
+                total_cost += decision["final_cost"]
                 
-                backend_id = result["decision"]["selected_backend_id"]
-                backend_usage[backend_id] = backend_usage.get(backend_id, 0) + 1
+                backend_id = decision["selected_backend_id"]
+                backend_usage[backend_id] += 1
         
         avg_latency = total_latency / successful_routes if successful_routes > 0 else 0
         avg_cost = total_cost / successful_routes if successful_routes > 0 else 0
         
-        # Find most used backend
-        most_used_backend = max(backend_usage.items(), key=lambda x: x[1]) if backend_usage else (None, 0)
+        # Find most used backend; ties go to the backend seen first, as with max()
+        most_used = backend_usage.most_common(1)
+        most_used_backend = most_used[0] if most_used else (None, 0)
         
         return {
             "total_requests": total_count,
@@ -273,6 +375,24 @@ class RoutingReport:
             "backend_usage": backend_usage
         }
     
+    @staticmethod
+    def to_json(summary: Dict[str, Any]) -> bytes:
+        """
+        Serialize a summary to compact UTF-8 JSON.
+        
+        Uses orjson when it is installed. The result is bytes, so it can be
+        written straight to sys.stdout.buffer or a file opened in binary mode.
+        
+        Args:
+            summary: The summary dictionary from generate_summary
+            
+        Returns:
+            The JSON document as bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(summary)
+        return json.dumps(summary, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    
     @staticmethod
     def print_summary(summary: Dict[str, Any]) -> None:
         """
@@ -281,28 +401,29 @@ class RoutingReport:
         Args:
             summary: The summary dictionary from generate_summary
         """
-        c = ColorFormatter
-        
-        print(f"\n{c.BOLD}{c.BLUE}===== TESSERACT ROUTING SUMMARY ====={c.RESET}\n")
+        lines = [_HEADER_SUMMARY]
         
-        print(f"{c.BOLD}Request Statistics:{c.RESET}")
-        print(f"  Total Requests: {summary['total_requests']}")
-        print(f"  Successful Routes: {summary['successful_routes']} ({summary['success_rate']:.1f}%)")
-        print(f"  Failed Routes: {summary['failed_routes']}")
-        print(f"  Fallback Routes: {summary['fallback_routes']} ({summary['fallback_percentage']:.1f}% of successful)")
+        lines.append(_LABEL_REQUEST_STATS)
+        lines.append(f"  Total Requests: {summary['total_requests']}")
+        lines.append(f"  Successful Routes: {summary['successful_routes']} ({summary['success_rate']:.1f}%)")
+        lines.append(f"  Failed Routes: {summary['failed_routes']}")
+        lines.append(f"  Fallback Routes: {summary['fallback_routes']} ({summary['fallback_percentage']:.1f}% of successful)")
         
-        print(f"\n{c.BOLD}Performance Metrics:{c.RESET}")
-        print(f"  Average Latency: {summary['avg_latency_ms']:.2f} ms")
-        print(f"  Average Cost: ${summary['avg_cost']:.6f}")
+        lines.append(_LABEL_PERFORMANCE)
+        lines.append(f"  Average Latency: {summary['avg_latency_ms']:.2f} ms")
+        lines.append(f"  Average Cost: ${summary['avg_cost']:.6f}")
         
-        print(f"\n{c.BOLD}Backend Usage:{c.RESET}")
+        lines.append(_LABEL_USAGE)
         if summary['most_used_backend']:
-            print(f"  Most Used Backend: {summary['most_used_backend']} ({summary['most_used_backend_count']} requests)")
+            lines.append(f"  Most Used Backend: {summary['most_used_backend']} ({summary['most_used_backend_count']} requests)")
         
         if summary['backend_usage']:
-            print("  All Backends:")
-            for backend_id, count in sorted(summary['backend_usage'].items(), key=lambda x: x[1], reverse=True):
-                percentage = (count / summary['successful_routes'] * 100) if summary['successful_routes'] > 0 else 0
-                print(f"    {backend_id}: {count} requests ({percentage:.1f}%)")
-        
-        print()
\ No newline at end of file
+            lines.append("  All Backends:")
+            successful_routes = summary['successful_routes']
+            row = _USAGE_ROW
+            for backend_id, count in sorted(summary['backend_usage'].items(), key=itemgetter(1), reverse=True):
+                percentage = (count / successful_routes * 100) if successful_routes > 0 else 0
+                lines.append(row % (backend_id, count, percentage))
+        
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")